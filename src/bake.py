@@ -0,0 +1,170 @@
+"""Bakes the game's images into assets/baked, so startup loads them ready-made.
+
+Scales every image down to the size it is drawn at, rounds and scales the
+shop icons, rasterizes the SVG arrows and, with --rotations, pre-rotates
+the bullets into sprite sheets (rotating 30x30 bullets at load is faster
+than decoding a sheet on desktop, measure before shipping one). manifest.json records the size and hash of
+each baked file and of its source. The game only compares sizes, and
+falls back to the raw file when they differ. --check compares the hashes
+too and lists what needs baking again, without baking anything.
+
+Run from the repository root so asset paths resolve:
+
+    python src/bake.py
+    python src/bake.py --rotations
+    python src/bake.py --check
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import json
+import time
+import pygame
+from engine.AssetCache import AssetCache, PRELOAD, BACKGROUND, ROTATED
+from engine.Atlas import TextureAtlas
+from engine.Baked import BAKED_DIR, MANIFEST, BAKE_VERSION, spec_key, file_hash, file_size
+from engine.RotationCache import ROTATION_STEP
+from sprites.Shop import ICONS, ICON_SIZE, ICON_RADIUS, ARROWS, ARROW_SIZE
+
+def baked_name(path, size, digest, radius=None, suffix=""):
+    """File name of a baked image, the source hash in it keeps stale files apart."""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    # Opaque JPEGs stay JPEGs, everything else (SVGs too) becomes PNG
+    ext = ".jpg" if ext.lower() in (".jpg", ".jpeg") else ".png"
+    rounded = f".r{radius}" if radius is not None else ""
+    return f"{stem}.{size[0]}x{size[1]}{rounded}{suffix}.{digest[:8]}{ext}"
+
+def manifest_files(directory):
+    """File names an existing manifest in directory lists, None if there is no manifest."""
+    path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        manifest = json.load(file)
+    entries = list(manifest.get("entries", {}).values()) + list(manifest.get("rotations", {}).values())
+    # Plain names only, a manifest never points outside its own directory
+    return {entry["file"] for entry in entries if os.path.basename(entry["file"]) == entry["file"]}
+
+def check(directory=BAKED_DIR):
+    """Manifest entries whose source or baked file no longer matches its recorded size and hash, as messages."""
+    path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(path):
+        return [f"No {MANIFEST} in {directory}"]
+    with open(path) as file:
+        manifest = json.load(file)
+    if manifest.get("version") != BAKE_VERSION:
+        return [f"{MANIFEST} is from bake version {manifest.get('version')}, the game wants {BAKE_VERSION}"]
+
+    stale = []
+    for entry in list(manifest["entries"].values()) + list(manifest["rotations"].values()):
+        baked = os.path.join(directory, entry["file"])
+        if (file_size(entry["source"]), file_hash(entry["source"])) != (entry["source_size"], entry["source_sha1"]):
+            stale.append(f"{entry['source']} changed since {entry['file']} was baked")
+        elif (file_size(baked), file_hash(baked)) != (entry["file_size"], entry["file_sha1"]):
+            stale.append(f"{entry['file']} is missing or changed")
+    return stale
+
+def bake(directory=BAKED_DIR, rotations=False, step=ROTATION_STEP):
+    """Write every baked image and the manifest, return the manifest.
+
+    Files an earlier bake listed in directory's manifest and this one no
+    longer needs are deleted. Nothing else in directory is touched, and
+    without an earlier manifest nothing is deleted.
+    """
+    os.makedirs(directory, exist_ok=True)
+    previous = manifest_files(directory)
+    raw = AssetCache(use_baked=False)  # Always bake from the source files
+    entries = {}
+    sheets = {}
+    skipped = []
+
+    def save(surface, path, size, radius=None, suffix=""):
+        digest = file_hash(path)
+        name = baked_name(path, size, digest, radius, suffix)
+        baked = os.path.join(directory, name)
+        pygame.image.save(surface, baked)
+        # The game compares the sizes at startup, --check the hashes
+        return {"source": path.replace(os.sep, "/"), "source_sha1": digest, "source_size": file_size(path),
+                "file": name, "file_sha1": file_hash(baked), "file_size": file_size(baked)}
+
+    scaled = [(path, size, True) for path, size in PRELOAD + [(ARROWS[0], ARROW_SIZE), (ARROWS[1], ARROW_SIZE)]]
+    scaled.append((*BACKGROUND, False))
+    for path, size, alpha in scaled:
+        try:
+            surface = raw.get(path, size, alpha)
+        except (pygame.error, FileNotFoundError) as e:
+            skipped.append(f"{path}: {e}")
+            continue
+        original = raw.get(path, None, alpha)
+        if not path.endswith(".svg") and size[0] * size[1] > original.get_width() * original.get_height():
+            # Upscaled, the baked file would be bigger and slower to decode than scaling at load
+            continue
+        entries[spec_key(path, size)] = save(surface, path, size)
+
+    icon_size = (ICON_SIZE, ICON_SIZE)
+    for path in ICONS.values():
+        try:
+            surface = raw.load_rounded(path, icon_size, ICON_RADIUS)
+        except (pygame.error, FileNotFoundError) as e:
+            skipped.append(f"{path}: {e}")
+            continue
+        entries[spec_key(path, icon_size, ICON_RADIUS)] = save(surface, path, icon_size, ICON_RADIUS)
+
+    if rotations:
+        for path, size in ROTATED:
+            image = raw.get(path, size)
+            # Same rotations RotationCache would make, packed into one sheet
+            sheet = TextureAtlas({angle: pygame.transform.rotate(image, angle) for angle in range(0, 360, step)})
+            entry = save(sheet.surface, path, size, suffix=".rotations")
+            entry["frames"] = [[angle, *sheet.region(angle)] for angle in sorted(sheet.regions)]
+            sheets[spec_key(path, size)] = entry
+
+    manifest = {"version": BAKE_VERSION, "entries": entries, "rotations": sheets}
+    with open(os.path.join(directory, MANIFEST), "w") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+
+    # Files from older bakes
+    current = {entry["file"] for entry in list(entries.values()) + list(sheets.values())}
+    if previous is None:
+        print(f"No earlier {MANIFEST} in {directory}, not cleaning it")
+    else:
+        for name in previous - current:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                os.remove(path)
+
+    for reason in skipped:
+        print(f"Skipped {reason}")
+    return manifest
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rotations", action="store_true", help="also pre-rotate the bullets into sprite sheets")
+    parser.add_argument("--out", default=BAKED_DIR, help=f"output directory (default {BAKED_DIR})")
+    parser.add_argument("--check", action="store_true", help="list stale baked files by hash instead of baking")
+    args = parser.parse_args()
+
+    if args.check:
+        stale = check(args.out)
+        for reason in stale:
+            print(reason)
+        print(f"{len(stale)} stale" if stale else "Baked files are current")
+        raise SystemExit(1 if stale else 0)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # convert_alpha() needs a video mode, bake the pixels the game would make
+    start = time.perf_counter()
+    manifest = bake(args.out, args.rotations)
+    elapsed = time.perf_counter() - start
+
+    files = [entry["file"] for entry in list(manifest["entries"].values()) + list(manifest["rotations"].values())]
+    baked_bytes = sum(os.path.getsize(os.path.join(args.out, name)) for name in files)
+    sources = {entry["source"] for entry in manifest["entries"].values()}
+    source_bytes = sum(os.path.getsize(source) for source in sources)
+    print(f"Baked {len(files)} files into {args.out} in {elapsed:.2f}s")
+    print(f"{baked_bytes} bytes baked, from {source_bytes} bytes of source images")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
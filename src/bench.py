@@ -0,0 +1,326 @@
+"""Performance benchmarks, run headless from the repository root:
+
+    python src/bench.py plastics
+    python src/bench.py collisions
+    python src/bench.py idle
+    python src/bench.py frames --json frames.json
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import asyncio
+import json
+import math
+import time
+import pygame
+from engine.World import World, Inputs, HeldKeys
+from engine.PlasticStore import PlasticStore
+from engine.PhaseTimer import PhaseTimer
+from engine.Rng import rng, reseed
+from engine.AssetCache import assets, BACKGROUND
+from engine.Fonts import fonts, text_cache
+from engine.Idle import IdleScreen
+from engine.Hud import Hud
+from engine.RenderQueue import RenderQueue, queue_world, HUD, CROSSHAIR
+from headless import autopilot
+from sprites.Plastic import Plastic, PlasticBoss
+from sprites.Bullet import TurtleBullet
+from sprites.Shop import Shop
+
+SEED = 1234  # Every scenario starts from the same random state
+SCENARIO_FRAMES = 600  # Ten seconds of play at 60 Hz
+MENU_FPS = 120  # main.MAX_FPS, what a menu ticks at when it redraws every frame
+DT = 1 / 60
+
+def bench_plastics(counts=(100, 500, 2000), ticks=200, dt=1 / 60, repeats=3):
+    """Plastics moved per millisecond: the original per-sprite chase, then the flow field per sprite and in the NumPy store.
+
+    "chase" is every sprite's own update() heading for its target with
+    Vector2 maths, the way plastics moved before the store and the field.
+    The crab walks a circle so the field keeps being rebuilt. Each row is
+    the best of repeats runs, like timeit.
+    """
+    # (name, NumPy store, flow field)
+    paths = [("chase", False, False)]
+    if PlasticStore.available:
+        paths += [("sprites", False, True), ("numpy", True, True)]
+    else:
+        print("numpy not installed, the flow field is off and only the chase is measured")
+
+    results = []
+    for count in counts:
+        # Repeats go round every path in turn, so a slow spell hits them all alike
+        best_ms = {}
+        for _ in range(repeats):
+            for name, use_store, use_flow in paths:
+                reseed(count)
+                world = World(use_plastic_store=use_store)
+                world.reset(20)
+                for _ in range(count):
+                    plastic = Plastic(world.crab, world.turtle, world.size, world.wave_number)
+                    plastic.move_to((rng.uniform(100, 700), rng.uniform(50, 550)))
+                    world.plastic_group.add(plastic)
+
+                crab = world.crab
+                start = time.perf_counter()
+                for tick in range(ticks):
+                    angle = tick * dt
+                    crab.pos.update(200 + 100 * math.cos(angle), 200 + 100 * math.sin(angle))
+                    crab.rect.center = crab.pos
+                    if use_flow:
+                        world.flow.update(world.players)
+                        world.plastic_group.update(dt, world.flow)
+                    else:
+                        world.plastic_group.update(dt)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                best_ms[name] = min(best_ms.get(name, elapsed_ms), elapsed_ms)
+
+        for name, _, _ in paths:
+            results.append({
+                "path": name,
+                "plastics": count,
+                "ms_per_tick": best_ms[name] / ticks,
+                "plastics_per_ms": count * ticks / best_ms[name],
+            })
+    return results
+
+def bench_collisions(counts=(100, 500, 2000), bullets=64, ticks=200):
+    """Collision phase cost with rect tests only against rect tests plus the mask narrow phase.
+
+    Plastics never die and bullets that hit come back, so every tick tests
+    the same pairs. Masks are only compared for pairs whose rects overlap,
+    so the extra cost follows the hit count, not the plastic count.
+    """
+    results = []
+    for count in counts:
+        rect_ms = None
+        for narrow, precise in (("rect", False), ("mask", True)):
+            reseed(count)
+            world = World(use_plastic_store=False)
+            world.reset(20)
+            world.mask_collisions = precise
+            for _ in range(count):
+                plastic = Plastic(world.crab, world.turtle, world.size, world.wave_number)
+                plastic.move_to((rng.uniform(100, 700), rng.uniform(50, 550)))
+                world.plastic_group.add(plastic)
+            shots = [TurtleBullet((rng.uniform(0, 800), rng.uniform(0, 600)), (rng.uniform(0, 800), rng.uniform(0, 600)))
+                     for _ in range(bullets)]
+
+            hits = 0
+            start = time.perf_counter()
+            for _ in range(ticks):
+                world.turtle_bullets.add(shots)
+                world.plastic_hash.rebuild(world.plastic_group)
+                world.resolve_bullet_hits(world.turtle_bullets, 0)
+                world.crab.check_bullet_collision(world.plastic_hash, precise)
+                world.turtle.check_bullet_collision(world.plastic_hash, precise)
+                hits += bullets - len(world.turtle_bullets)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            row = {"narrow": narrow, "plastics": count, "bullets": bullets,
+                   "ms_per_tick": elapsed_ms / ticks, "bullet_hits_per_tick": hits / ticks}
+            if rect_ms is None:
+                rect_ms = elapsed_ms
+            else:
+                row["overhead"] = elapsed_ms / rect_ms - 1
+            results.append(row)
+    return results
+
+# Scenarios set up a world and return (script, overlay). script(world, inputs, frame)
+# feeds input before each step, overlay(screen, world) draws on top of the world.
+
+def scenario_wave1_idle(world, screen):
+    """Wave 1 with nobody touching the controls."""
+    world.reset(1)
+    return None, None
+
+def scenario_wave20(world, screen):
+    """Wave 20 and the waves after it, each all on screen at once, with both players firing at the nearest plastic."""
+    world.reset(20)
+
+    def script(world, inputs, frame):
+        # Wind the wave's clock to its last spawn, one a second would leave the autopilot shooting at one plastic at a time
+        schedule = world.schedule
+        if not schedule.done:
+            world.spawn(schedule.events[-1][0] - schedule.elapsed)
+        autopilot(world, inputs)
+    return script, None
+
+def scenario_boss_minions(world, screen):
+    """A boss wave where the boss holds still and spawns minions every half second instead of every five."""
+    world.reset(3)
+
+    def script(world, inputs, frame):
+        for plastic in world.plastic_group:
+            if isinstance(plastic, PlasticBoss):
+                plastic.speed = 0
+                plastic.spawn_interval = 0.5
+    return script, None
+
+def scenario_crab_fire(world, screen):
+    """The crab circles and fires every time its cooldown allows."""
+    world.reset(1)
+    directions = [HeldKeys(key) for key in (pygame.K_d, pygame.K_s, pygame.K_a, pygame.K_w)]
+
+    def script(world, inputs, frame):
+        inputs.keys = directions[frame // 30 % len(directions)]
+        inputs.crab_shoot = True
+    return script, None
+
+def scenario_plastics_2000(world, screen):
+    """2,000 plastics on screen, topped up every frame as they reach the players."""
+    world.reset(20)
+
+    def script(world, inputs, frame):
+        while len(world.plastic_group) < 2000:
+            plastic = world.plastic_pool.acquire(world.crab, world.turtle, world.size, world.wave_number)
+            plastic.move_to((rng.uniform(100, 700), rng.uniform(50, 550)))
+            world.plastic_group.add(plastic)
+    return script, None
+
+def scenario_shop_open(world, screen):
+    """The shop slid open over a wave in progress."""
+    world.reset(5)
+    shop = Shop(screen, fonts.get(30), world.turtle, world.crab,
+                pygame.Rect(screen.get_width() // 2 - 300, screen.get_height(), 600, 400))
+    shop.toggle()
+
+    def overlay(screen, world):
+        shop.update(world.coin_count, DT)
+        screen.blit(shop.image, shop.rect.topleft)
+    return None, overlay
+
+SCENARIOS = {
+    "wave1_idle": scenario_wave1_idle,
+    "wave20": scenario_wave20,
+    "boss_minions": scenario_boss_minions,
+    "crab_fire": scenario_crab_fire,
+    "plastics_2000": scenario_plastics_2000,
+    "shop_open": scenario_shop_open,
+}
+
+def draw_frame(screen, world, hud, background):
+    """Full redraw of a PLAYING frame, the same draw calls as main.run_level."""
+    screen.blit(background, (0, 0))
+    queue = RenderQueue()
+    queue_world(queue, world)
+    hud.draw(queue.on(HUD), world.turtle, world.crab, world.coin_count, world.wave_number)
+    queue.add_sprites(world.crosshair_group, CROSSHAIR)
+    queue.flush(screen)
+    for plastic in world.plastic_group:
+        plastic.draw_hitbox(screen)
+
+def run_scenario(name, screen, hud, background, frames=SCENARIO_FRAMES, seed=SEED):
+    """Play a scenario one sim step per frame, return its PhaseTimer, peak plastic count and budget stats."""
+    reseed(seed)
+    world = World(screen.get_size())
+    script, overlay = SCENARIOS[name](world, screen)
+    world.prewarm_pools()
+    timer = PhaseTimer()
+    world.timer = timer
+    inputs = Inputs()
+    peak_plastics = 0
+
+    for frame in range(frames):
+        timer.begin_frame()
+        # Players never die, so every scenario runs for its full length
+        world.turtle.health = world.crab.health = 3
+        if world.wave_cleared:
+            world.prewarm_pools()
+            world.start_wave()
+        if script is not None:
+            script(world, inputs, frame)
+        timer.lap("input")
+
+        world.step(DT, inputs)
+        peak_plastics = max(peak_plastics, len(world.plastic_group))
+
+        draw_frame(screen, world, hud, background)
+        if overlay is not None:
+            overlay(screen, world)
+        timer.lap("draw")
+        pygame.display.flip()
+        timer.lap("flip")
+        timer.end_frame()
+    return timer, peak_plastics, world.budget.stats()
+
+def open_display():
+    """Dummy-driver window plus what draw_frame() needs: (screen, hud, background)."""
+    screen = pygame.display.set_mode((800, 600))
+    assets.preload()
+    hud = Hud(assets.get("assets/images/coin.png", (30, 30)))
+    background = assets.get(*BACKGROUND, alpha=False)
+    return screen, hud, background
+
+def bench_frames(scenarios=tuple(SCENARIOS), frames=SCENARIO_FRAMES, seed=SEED):
+    """Per-phase frame timings (mean, p95, p99 in ms) for each scripted scenario."""
+    screen, hud, background = open_display()
+
+    results = []
+    for name in scenarios:
+        wall, cpu = time.perf_counter(), time.process_time()
+        timer, peak_plastics, budget = run_scenario(name, screen, hud, background, frames, seed)
+        cpu_percent = 100 * (time.process_time() - cpu) / (time.perf_counter() - wall)
+        row = {"scenario": name, "frames": frames, "seed": seed, "peak_plastics": peak_plastics,
+               "deferred": budget["deferred"], "dropped": budget["dropped"], "cpu_percent": cpu_percent}
+        for phase, stats in timer.summary().items():
+            for stat, value in stats.items():
+                row[f"{phase}_{stat}"] = value
+        results.append(row)
+    return results
+
+def bench_idle(seconds=3.0):
+    """CPU use of the start screen redrawn at the frame cap against composed once and waiting for input."""
+    screen, hud, background = open_display()
+    clock = pygame.time.Clock()
+
+    def compose():
+        screen.blit(background, (0, 0))
+        text = text_cache.render("Press any key to start!", 45, (255, 255, 255))
+        screen.blit(text, text.get_rect(center=screen.get_rect().center))
+
+    results = []
+    for mode in ("redraw", "idle"):
+        idle = IdleScreen()
+        wall, cpu = time.perf_counter(), time.process_time()
+        while time.perf_counter() - wall < seconds:
+            if mode == "redraw" or idle.dirty:
+                compose()
+                pygame.display.flip()
+                idle.drawn()
+            for event in pygame.event.get():
+                idle.watch(event)
+            if mode == "redraw":
+                clock.tick(MENU_FPS)
+            else:
+                asyncio.run(idle.wait())
+        elapsed = time.perf_counter() - wall
+        results.append({"mode": mode, "seconds": elapsed, "frames_composed": idle.redraws,
+                        "cpu_percent": 100 * (time.process_time() - cpu) / elapsed})
+    return results
+
+BENCHMARKS = {
+    "plastics": bench_plastics,
+    "collisions": bench_collisions,
+    "frames": bench_frames,
+    "idle": bench_idle,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a performance benchmark headless.")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--json", metavar="PATH", help="also write the results to a JSON file, for diffing between commits")
+    args = parser.parse_args()
+
+    pygame.init()
+    results = BENCHMARKS[args.benchmark]()
+    for row in results:
+        print("  ".join(f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}" for key, value in row.items()))
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"benchmark": args.benchmark, "results": results}, file, indent=2, sort_keys=True)
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import pygame
+from engine.Atlas import TextureAtlas, ATLAS_WIDTH
+from engine.Baked import BakedAssets
+
+# Every image the game uses, with the size it is drawn at. Preloaded once at
+# startup so that spawning plastics or firing bullets never touches the disk.
+PRELOAD = [
+    ("assets/images/turtle.png", (100, 100)),
+    ("assets/images/crab.png", (100, 80)),
+    ("assets/images/plastic.png", (40, 40)),
+    ("assets/images/Monster.png", (100, 100)),
+    ("assets/images/web.png", (30, 30)),
+    ("assets/images/crab_scute.png", (30, 30)),
+    ("assets/images/crosshair.png", (40, 40)),
+    ("assets/images/coin.png", (30, 30)),
+]
+BACKGROUND = ("assets/images/ocean.jpg", (800, 600))  # Opaque, not preloaded with the sprites
+# Images drawn at any angle, all their rotations are made before play
+ROTATED = [
+    ("assets/images/web.png", (30, 30)),
+    ("assets/images/crab_scute.png", (30, 30)),
+]
+
+def round_image(image, radius):
+    """Rounds the corners of an image using a mask."""
+    size = image.get_size()
+    mask = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(mask, (255, 255, 255, 255), (0, 0, *size), border_radius=radius)
+    rounded_image = image.copy()
+    rounded_image.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+    return rounded_image
+
+def _convert(surface, alpha):
+    # convert() needs a video mode, skip it when running without a window
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+class AssetCache:
+    """Loads, converts and scales each image once and hands out shared surfaces.
+
+    Images baked by bake.py are loaded ready-made, the raw file is only
+    read and scaled when there is no current baked copy.
+    """
+    def __init__(self, use_baked=True):
+        self.surfaces = {}  # (path, size, alpha) -> Surface
+        self._baked = None if use_baked else BakedAssets(None)  # Manifest, read on first load
+        self.hits = 0
+        self.misses = 0
+        self.runtime_misses = 0  # Misses after mark_running(), should stay at 0
+        self.running = False
+        self.log = None  # Told about each image loaded during gameplay, main sets it for --timing and --stats
+        self.atlases = []  # Every TextureAtlas, so texture memory is counted in one place
+
+    def get(self, path, size=None, alpha=True):
+        """Return the shared surface for an image, loading it on first use.
+
+        The returned surface is shared between every sprite that asks for it,
+        so callers must copy it before drawing on it.
+        """
+        key = (path, size, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if self.running:
+            self.runtime_misses += 1
+            # Once per key, a loaded image is a hit from then on
+            if self.log is not None:
+                self.log(f"AssetCache: {path} {size} loaded during gameplay")
+
+        surface = self._load(path, size, alpha)
+        self.surfaces[key] = surface
+        return surface
+
+    @property
+    def baked(self):
+        if self._baked is None:
+            self._baked = BakedAssets()
+        return self._baked
+
+    def _original(self, path, alpha):
+        # Reuse the unscaled original if it is cached
+        original = self.surfaces.get((path, None, alpha))
+        if original is None:
+            original = _convert(pygame.image.load(path), alpha)
+        return original
+
+    def _load(self, path, size, alpha):
+        baked = self.baked.lookup(path, size)
+        if baked is not None:
+            return _convert(pygame.image.load(baked), alpha)
+        original = self._original(path, alpha)
+        if size is None or original.get_size() == tuple(size):
+            return original
+        return pygame.transform.scale(original, size)
+
+    def load_rounded(self, path, size, radius):
+        """A new copy of an image with rounded corners, scaled to size. Not cached, the caller keeps it."""
+        baked = self.baked.lookup(path, size, radius)
+        if baked is not None:
+            return _convert(pygame.image.load(baked), True)
+        return pygame.transform.scale(round_image(self._original(path, True), radius), size)
+
+    def baked_rotations(self, path, size):
+        """{angle: surface} from a pre-rotated sprite sheet, empty if none was baked."""
+        found = self.baked.lookup_rotations(path, size)
+        if found is None:
+            return {}
+        sheet_path, frames = found
+        sheet = _convert(pygame.image.load(sheet_path), True)
+        return {angle: sheet.subsurface((x, y, w, h)) for angle, x, y, w, h in frames}
+
+    def preload(self, specs=PRELOAD):
+        """Load every (path, size) pair up front."""
+        for path, size in specs:
+            self.get(path, size)
+
+    def pack_atlas(self):
+        """Move every cached scaled image into one atlas and hand out views of it from now on.
+
+        Call after preload() and before anything holds on to the surfaces,
+        the separate copies are dropped. Unscaled originals and opaque
+        images (the background) stay as they are.
+        """
+        images = {key: surface for key, surface in self.surfaces.items()
+                  if key[1] is not None and key[2] and surface.get_parent() is None
+                  and surface.get_width() <= ATLAS_WIDTH}
+        if not images:
+            return None
+        atlas = self.add_atlas(images)
+        for key in images:
+            self.surfaces[key] = atlas.get(key)
+        return atlas
+
+    def add_atlas(self, images):
+        """Pack surfaces made elsewhere (shop icons) into an atlas counted with the cache's memory."""
+        atlas = TextureAtlas(images)
+        self.atlases.append(atlas)
+        return atlas
+
+    def mark_running(self):
+        """Called once gameplay starts, any later miss is reported as a runtime load."""
+        self.running = True
+
+    def memory_bytes(self):
+        """Total pixel memory held by cached surfaces and atlases, views into an atlas count once."""
+        separate = sum(surface.get_pitch() * surface.get_height()
+                       for surface in self.surfaces.values() if surface.get_parent() is None)
+        return separate + sum(atlas.memory_bytes() for atlas in self.atlases)
+
+    def stats(self):
+        return {
+            "surfaces": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "runtime_misses": self.runtime_misses,
+            "atlases": len(self.atlases),
+            "baked": self.baked.stats(),
+            "memory_bytes": self.memory_bytes(),
+        }
+
+# Shared instance used by all sprites
+assets = AssetCache()
@@ -0,0 +1,60 @@
+import pygame
+
+ATLAS_WIDTH = 512  # Images wider than this stay separate surfaces
+ATLAS_PADDING = 1  # Transparent pixels between packed images
+
+class TextureAtlas:
+    """Images packed into one surface, each reachable by key as a sub-rect of it.
+
+    get() hands out subsurface views, which share the atlas's pixels, so
+    sprites can keep blitting self.image as usual and that blit is the same
+    as blit(atlas.surface, pos, area). Rotating, masking or copying a view
+    works like it does on any other surface.
+    """
+    def __init__(self, images, width=ATLAS_WIDTH, padding=ATLAS_PADDING):
+        self.regions = {}  # key -> Rect in the atlas
+        self.views = {}  # key -> subsurface
+
+        # Shelf packing: tallest first, left to right, a new shelf when a row is full
+        order = sorted(images, key=lambda key: images[key].get_height(), reverse=True)
+        x = y = shelf_height = used_width = 0
+        for key in order:
+            w, h = images[key].get_size()
+            if x and x + w > width:
+                x = 0
+                y += shelf_height + padding
+                shelf_height = 0
+            self.regions[key] = pygame.Rect(x, y, w, h)
+            x += w + padding
+            shelf_height = max(shelf_height, h)
+            used_width = max(used_width, x - padding)
+
+        self.surface = pygame.Surface((max(used_width, 1), max(y + shelf_height, 1)), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        for key, region in self.regions.items():
+            # MAX onto clear pixels copies the image exactly, a normal blit would blend its edges
+            self.surface.blit(images[key], region, special_flags=pygame.BLEND_RGBA_MAX)
+            self.views[key] = self.surface.subsurface(region)
+
+    def region(self, key):
+        """The image's sub-rect in the atlas surface."""
+        return self.regions[key]
+
+    def get(self, key):
+        """A view of the image that draws from the atlas's pixels."""
+        return self.views[key]
+
+    def __contains__(self, key):
+        return key in self.regions
+
+    def __len__(self):
+        return len(self.regions)
+
+    def memory_bytes(self):
+        return self.surface.get_pitch() * self.surface.get_height()
+
+    def packed_bytes(self):
+        """Pixel memory the packed images would take as separate surfaces."""
+        return sum(region.width * region.height * 4 for region in self.regions.values())
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+
+BAKED_DIR = os.path.join("assets", "baked")
+MANIFEST = "manifest.json"
+BAKE_VERSION = 3  # Bump when baking or the manifest changes, older manifests are then ignored
+
+def spec_key(path, size, radius=None):
+    """Manifest key of an image baked at a size, with rounded corners if radius is given."""
+    key = f"{path.replace(os.sep, '/')}|{size[0]}x{size[1]}"
+    return key if radius is None else f"{key}|r{radius}"
+
+def file_hash(path):
+    """SHA-1 of a file's bytes, None if it doesn't exist. Only bake.py hashes, the game compares file_size()s."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+def file_size(path):
+    """Size of a file in bytes, None if it doesn't exist."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+class BakedAssets:
+    """The manifest bake.py writes, mapping image specs to pre-processed files.
+
+    Nothing is hashed at runtime and the manifest is trusted. An entry is
+    used when its baked file, and its source if present, still have the
+    sizes they were baked with. Sizes survive a git checkout or a copy that
+    modification times don't. An edit that keeps a source's size is only
+    caught by bake.py --check, which compares hashes.
+    """
+    def __init__(self, directory=BAKED_DIR):
+        # None for an empty manifest, so everything loads raw
+        self.directory = directory
+        self.entries = {}
+        self.rotations = {}
+        self.checked = {}  # Baked file -> whether it is current, each is checked once
+        self.hits = 0
+        self.stale = 0
+
+        path = os.path.join(directory, MANIFEST) if directory is not None else None
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                manifest = json.load(file)
+            if manifest.get("version") == BAKE_VERSION:
+                self.entries = manifest.get("entries", {})
+                self.rotations = manifest.get("rotations", {})
+
+    def _current(self, entry):
+        name = entry["file"]
+        if name not in self.checked:
+            source = file_size(entry["source"])
+            current = (file_size(os.path.join(self.directory, name)) == entry["file_size"] and
+                       source in (None, entry["source_size"]))
+            self.checked[name] = current
+            if not current:
+                self.stale += 1
+        return self.checked[name]
+
+    def lookup(self, path, size, radius=None):
+        """Path of the baked file for an image spec, None if there is none or it is stale."""
+        if size is None:
+            return None
+        entry = self.entries.get(spec_key(path, size, radius))
+        if entry is None or not self._current(entry):
+            return None
+        self.hits += 1
+        return os.path.join(self.directory, entry["file"])
+
+    def lookup_rotations(self, path, size):
+        """(sheet path, [(angle, x, y, w, h)]) of a pre-rotated sprite sheet, None if there is none or it is stale."""
+        if size is None:
+            return None
+        entry = self.rotations.get(spec_key(path, size))
+        if entry is None or not self._current(entry):
+            return None
+        self.hits += 1
+        return os.path.join(self.directory, entry["file"]), entry["frames"]
+
+    def stats(self):
+        return {"entries": len(self.entries) + len(self.rotations), "hits": self.hits, "stale": self.stale}
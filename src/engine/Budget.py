@@ -0,0 +1,153 @@
+from collections import deque
+
+# What happens to a boss minion that would go over the cap
+DEFER = "defer"  # Wait in a queue until there is room, dropped if the queue is full
+MERGE = "merge"  # Add its health to the weakest plastic instead
+DESPAWN_OLDEST = "despawn_oldest"  # Remove the oldest plastic to make room
+
+POLICIES = (DEFER, MERGE, DESPAWN_OLDEST)
+
+class EntityBudget:
+    """Caps how many plastics are alive at once.
+
+    Every spawn is checked on its own against the cap and the policy, boss
+    minions through admit_minion() and scheduled wave spawns through
+    admit_spawn(). A wave spawn that can't get in stays in the wave's
+    schedule instead of the minion queue, so a wave still spawns
+    everything it should.
+    """
+    def __init__(self, cap=400, policy=DEFER, max_deferred=64, merge_health=100):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown budget policy {policy!r}, expected one of {POLICIES}")
+        self.cap = cap
+        self.policy = policy
+        self.max_deferred = max_deferred
+        self.merge_health = merge_health  # A new plastic's health, added to the weakest when merging
+        self.waiting = deque()  # Bosses owed one deferred minion each
+        self.order = deque()  # (serial, plastic) in spawn order, for DESPAWN_OLDEST
+        self.serial = 0
+
+        # Metrics
+        self.requested = 0  # Minions bosses tried to spawn
+        self.spawned = 0  # Minions that made it in, now or after waiting
+        self.deferred = 0  # Minions that had to wait
+        self.dropped = 0  # Minions that never spawned
+        self.merged = 0
+        self.despawned = 0  # Plastics removed to make room
+        self.stalled_ticks = 0  # Ticks the wave schedule was held back
+
+    def has_room(self, group):
+        return len(group) < self.cap
+
+    def track(self, plastic):
+        """Note a new plastic's spawn order, only needed when despawning the oldest."""
+        if self.policy != DESPAWN_OLDEST:
+            return
+        self.serial += 1
+        plastic.spawn_serial = self.serial
+        self.order.append((self.serial, plastic))
+        if len(self.order) > 4 * self.cap:
+            # Forget plastics that died, or were recycled by their pool, on their own
+            self.order = deque(entry for entry in self.order if self._current(entry))
+
+    def _current(self, entry):
+        serial, plastic = entry
+        return plastic.alive() and getattr(plastic, "spawn_serial", None) == serial
+
+    def _oldest(self):
+        while self.order:
+            entry = self.order.popleft()
+            if self._current(entry) and not hasattr(entry[1], "update_spawner"):
+                return entry[1]
+        return None
+
+    def _weakest(self, group):
+        weakest = None
+        for plastic in group:
+            if not hasattr(plastic, "update_spawner") and (weakest is None or plastic.health < weakest.health):
+                weakest = plastic
+        return weakest
+
+    def admit_minion(self, boss, group):
+        """Whether a minion the boss wants to spawn may spawn right now."""
+        self.requested += 1
+        if self.has_room(group):
+            self.spawned += 1
+            return True
+
+        if self.policy == DEFER:
+            if len(self.waiting) < self.max_deferred:
+                self.waiting.append(boss)
+                self.deferred += 1
+            else:
+                self.dropped += 1
+        elif self.policy == MERGE:
+            weakest = self._weakest(group)
+            if weakest is not None:
+                weakest.health += self.merge_health
+                self.merged += 1
+            else:
+                self.dropped += 1
+        else:
+            oldest = self._oldest()
+            if oldest is not None:
+                oldest.kill()
+                self.despawned += 1
+                self.spawned += 1
+                return True
+            self.dropped += 1
+        return False
+
+    def admit_spawn(self, boss, group):
+        """What to do with a scheduled wave spawn that is due now.
+
+        True to spawn it, False if it was merged into the weakest plastic
+        instead, None to leave it queued for a later tick. A boss never
+        merges, under MERGE it waits for room like under DEFER.
+        """
+        if self.has_room(group):
+            return True
+
+        if self.policy == MERGE and not boss:
+            weakest = self._weakest(group)
+            if weakest is not None:
+                weakest.health += self.merge_health
+                self.merged += 1
+                return False
+        elif self.policy == DESPAWN_OLDEST:
+            oldest = self._oldest()
+            if oldest is not None:
+                oldest.kill()
+                self.despawned += 1
+                return True
+        return None
+
+    def release(self, group):
+        """Spawn deferred minions while there is room, once per tick."""
+        while self.waiting and self.has_room(group):
+            boss = self.waiting.popleft()
+            if boss.alive():
+                boss.spawn_minion()
+                self.spawned += 1
+            else:
+                self.dropped += 1
+
+    def clear(self):
+        """Forget waiting minions and spawn order, for a new game."""
+        self.dropped += len(self.waiting)
+        self.waiting.clear()
+        self.order.clear()
+
+    def stats(self):
+        return {
+            "cap": self.cap,
+            "policy": self.policy,
+            "requested": self.requested,
+            "spawned": self.spawned,
+            "deferred": self.deferred,
+            "waiting": len(self.waiting),
+            "dropped": self.dropped,
+            "merged": self.merged,
+            "despawned": self.despawned,
+            "stalled_ticks": self.stalled_ticks,
+        }
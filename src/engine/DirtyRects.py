@@ -0,0 +1,77 @@
+import pygame
+
+class DirtyRectRenderer:
+    """Tracks what was drawn each frame so only those regions are restored and pushed.
+
+    Every frame the regions drawn in the previous frame are restored from the
+    background, the caller draws and reports the rects it touched, and
+    present() pushes the old and new regions with display.update(). When the
+    dirty area gets too large a single full flip is cheaper, so it falls back
+    to that and redraws the whole background on the next frame.
+    """
+    def __init__(self, screen, background, fallback_color=(0, 0, 50), enabled=True, max_dirty_fraction=0.5):
+        self.screen = screen
+        self.background = background
+        self.fallback_color = fallback_color
+        self.enabled = enabled
+        self.max_dirty_area = screen.get_width() * screen.get_height() * max_dirty_fraction
+        self.previous = []  # Rects drawn last frame
+        self.current = []  # Rects drawn this frame
+        self.full_redraw = True
+
+        # Stats for the last presented frame
+        self.full_flips = 0
+        self.partial_updates = 0
+        self.last_dirty_area = 0
+
+    def invalidate(self):
+        """Force a full background redraw and flip, e.g. after another screen was shown."""
+        self.full_redraw = True
+
+    def _restore(self, rect=None):
+        if self.background:
+            if rect is None:
+                self.screen.blit(self.background, (0, 0))
+            else:
+                self.screen.blit(self.background, rect, rect)
+        else:
+            self.screen.fill(self.fallback_color, rect)
+
+    def begin_frame(self):
+        """Erase last frame's sprites by restoring the background under them."""
+        if self.full_redraw or not self.enabled:
+            self._restore()
+        else:
+            for rect in self.previous:
+                self._restore(rect)
+
+    def add_rect(self, rect):
+        if self.enabled:
+            self.current.append(rect)
+
+    def add_rects(self, rects):
+        if self.enabled:
+            self.current.extend(rects)
+
+    def present(self):
+        """Push this frame to the display and roll the rect lists over."""
+        if not self.enabled:
+            pygame.display.flip()
+            return
+
+        screen_rect = self.screen.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in self.previous + self.current]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        self.last_dirty_area = sum(rect.width * rect.height for rect in dirty)
+
+        if self.full_redraw or self.last_dirty_area > self.max_dirty_area:
+            pygame.display.flip()
+            self.full_flips += 1
+            # Restoring many overlapping rects costs more than one full blit
+            self.full_redraw = self.last_dirty_area > self.max_dirty_area
+        else:
+            pygame.display.update(dirty)
+            self.partial_updates += 1
+
+        self.previous = self.current
+        self.current = []
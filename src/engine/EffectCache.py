@@ -0,0 +1,51 @@
+import pygame
+
+class EffectCache:
+    """Flash, greyscale and tinted variants of shared surfaces, each made once.
+
+    Variants are keyed by the base surface and the effect's parameters, so
+    a blinking sprite or a hovered button blits a ready-made surface
+    instead of copying and filling one every frame.
+    """
+    def __init__(self):
+        self.variants = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key, make):
+        variant = self.variants.get(key)
+        if variant is not None:
+            self.hits += 1
+            return variant
+        self.misses += 1
+        variant = make()
+        self.variants[key] = variant
+        return variant
+
+    def flash(self, surface, amount=60):
+        """Brightened copy, for hit flashes."""
+        def make():
+            variant = surface.copy()
+            variant.fill((255, 255, 255, amount), special_flags=pygame.BLEND_ADD)
+            return variant
+        return self._get((surface, "flash", amount), make)
+
+    def grey(self, surface):
+        """Greyscale copy, for things that can't be used any more."""
+        return self._get((surface, "grey"), lambda: pygame.transform.grayscale(surface))
+
+    def tint(self, surface, color):
+        """Copy multiplied by an RGBA colour, for dimming and hover states."""
+        color = tuple(color)
+
+        def make():
+            variant = surface.copy()
+            variant.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+            return variant
+        return self._get((surface, "tint", color), make)
+
+    def stats(self):
+        return {"variants": len(self.variants), "hits": self.hits, "misses": self.misses}
+
+# Shared instance
+effects = EffectCache()
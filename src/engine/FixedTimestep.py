@@ -0,0 +1,34 @@
+class FixedTimestep:
+    """Accumulator that turns variable frame times into whole fixed-size sim steps."""
+    def __init__(self, hz=60, max_steps=5):
+        self.dt = 1 / hz
+        self.max_steps = max_steps  # Cap per frame so a long stall can't snowball
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """Add a frame's real time in seconds and return how many sim steps to run."""
+        self.accumulator += min(frame_time, self.max_steps * self.dt)
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self):
+        """How far the render time is between the last two sim states (0 to 1)."""
+        return self.accumulator / self.dt
+
+def snapshot(groups):
+    """Start a sim step: remember each sprite's position and put its rect back on it."""
+    for group in groups:
+        for sprite in group:
+            sprite.prev_pos.update(sprite.pos)
+            sprite.rect.center = sprite.pos
+
+def interpolate(groups, alpha):
+    """Move each sprite's rect between its previous and current sim position for drawing."""
+    for group in groups:
+        for sprite in group:
+            sprite.rect.center = sprite.prev_pos.lerp(sprite.pos, alpha)
@@ -0,0 +1,251 @@
+import math
+from itertools import compress
+import pygame
+
+# NumPy is optional, without it the World has no field and plastics chase their own target
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FLOW_CELL = 40  # Pixels per grid cell, the size of a plastic
+FLOW_SLACK = 20  # Pixels a player may move inside its cell before the grid is rebuilt, half a cell like the grid's own error
+NEAR_CELLS = 1  # Cells this close to their target steer straight at it instead of along the grid
+SEPARATION = 0.5  # Weight of the push away from crowded cells, against 1 for the flow direction
+
+class FlowField:
+    """Coarse grid of directions toward the nearest living player, shared by every plastic.
+
+    rebuild() finds the nearest player for every cell in one NumPy pass, so
+    a plastic only looks up its cell instead of measuring the distance to
+    every player. Around each player the grid is too coarse to aim with, so
+    a lone plastic within NEAR_CELLS of its player steers straight at it.
+
+    Moving plastics are counted per cell as they steer. On the next update()
+    a cell that held more than one is pushed toward its emptier neighbours,
+    once for the whole cell, and every plastic there follows the cell's
+    direction plus push, near a player too, so a crowd spreads over the
+    cells around it instead of stacking on one point. Cells are looked up
+    from rect centers, the same whole pixels whether plastics update
+    themselves or live in a PlasticStore.
+    """
+    available = np is not None
+
+    def __init__(self, size, cell=FLOW_CELL, slack=FLOW_SLACK, near=NEAR_CELLS, separation=SEPARATION):
+        self.cell = cell
+        self.slack = slack
+        self.near_cells = near
+        self.separation = separation
+        self.cols = max(1, -(-size[0] // cell))
+        self.rows = max(1, -(-size[1] // cell))
+        cells = self.cols * self.rows
+        rows, cols = np.divmod(np.arange(cells), self.cols)
+        self.cell_x = (cols + 0.5) * cell  # Cell centers, row by row
+        self.cell_y = (rows + 0.5) * cell
+        self.cell_index = np.arange(cells)
+
+        # Pixel -> column and pixel -> row offset, from a screen before the grid to a screen after it.
+        # Anything further out is clamped to the edge cells like the lookups inside the range.
+        self.margin = max(size)
+        span = np.arange(-self.margin, max(size) * 2 + self.margin)
+        self.col_lut = np.clip(span // cell, 0, self.cols - 1)
+        self.row_lut = np.clip(span // cell, 0, self.rows - 1) * self.cols
+        self.col_list, self.row_list = self.col_lut.tolist(), self.row_lut.tolist()
+        self.lut_size = len(span)
+
+        # Per cell, row by row: unit flow direction and the nearest target
+        self.dx = [0.0] * cells
+        self.dy = [0.0] * cells
+        self.plain_x = np.zeros(cells)  # dx, dy as arrays for grid()
+        self.plain_y = np.zeros(cells)
+        self.target = [0] * cells
+        self.nearest = np.zeros(cells, np.int64)
+        self.around = []  # Cells within NEAR_CELLS of their own target
+        # Per cell and tick: the direction plastics there follow, and whether a lone plastic aims at its target instead
+        self.steer_x = [0.0] * cells
+        self.steer_y = [0.0] * cells
+        self.aimed = [False] * cells
+        self.vectors = [None] * cells  # steer_x, steer_y as shared Vector2s, made when a plastic first asks
+        self.changed = []  # Crowded cells pushed this tick, put back to the plain grid on the next
+        self.count = [0] * cells  # Moving plastics per cell last tick
+        self.counting = [0] * cells  # Filled in by this tick's steering
+        self.crowding = None  # Cells counting more than one, when count_cells() already knows them
+
+        self.targets = []  # Sprites steered toward, the living players at the last rebuild
+        self.centers = []  # Their rect centers this tick
+        self.points = []  # The same centers as Vector2, to aim at
+        self.rebuilt_centers = []  # Their rect centers at the last rebuild
+        self.rebuilt_cells = []  # And the cells those were in
+        self.rebuilds = 0
+        self.tick_arrays = None  # (steer_x, steer_y, aimed) as NumPy arrays, made once per tick on demand
+
+    def reset(self):
+        """Forget the players and the crowd, so the next update() starts from scratch like a new field."""
+        self.targets = []
+        self.centers = []
+        self.points = []
+        self.rebuilt_centers = []
+        self.rebuilt_cells = []
+        self.count = [0] * len(self.count)
+        self.counting = [0] * len(self.count)
+        self.crowding = None
+
+    def cell_of(self, x, y):
+        """Index of the cell containing a pixel, pixels off the grid use the nearest edge cell."""
+        i, j, last = x + self.margin, y + self.margin, self.lut_size - 1
+        if not (0 <= i <= last and 0 <= j <= last):
+            i, j = min(max(i, 0), last), min(max(j, 0), last)
+        return self.row_list[j] + self.col_list[i]
+
+    def cells_of(self, pixels):
+        """cell_of() for an (n, 2) integer array of pixels."""
+        return (np.take(self.row_lut, pixels[:, 1] + self.margin, mode="clip") +
+                np.take(self.col_lut, pixels[:, 0] + self.margin, mode="clip"))
+
+    def rebuild(self, living, centers):
+        """Point every cell at the nearest of the living players, whose rect centers are given."""
+        self.targets = living
+        self.rebuilt_centers = centers
+        self.rebuilt_cells = [self.cell_of(*center) for center in centers]
+        points = np.array(centers, np.float64)
+
+        # (targets, cells) offsets, the first target wins ties like a min() over the players would
+        off_x = points[:, 0, None] - self.cell_x
+        off_y = points[:, 1, None] - self.cell_y
+        distance = off_x * off_x + off_y * off_y
+        nearest = np.argmin(distance, axis=0)
+        cells = self.cell_index
+        dx, dy = off_x[nearest, cells], off_y[nearest, cells]
+        length = np.sqrt(distance[nearest, cells])
+        length[length == 0] = 1  # A target exactly on a cell center leaves that cell still
+        dx /= length
+        dy /= length
+
+        self.nearest, self.plain_x, self.plain_y = nearest, dx, dy
+        self.dx, self.dy, self.target = dx.tolist(), dy.tolist(), nearest.tolist()
+        self.steer_x, self.steer_y = list(self.dx), list(self.dy)
+        self.aimed = [False] * len(self.dx)
+        self.vectors = [None] * len(self.dx)
+        self.changed = []
+
+        # The few cells around each target, in plain Python
+        self.around = []
+        cols, reach = self.cols, self.near_cells
+        for number, home in enumerate(self.rebuilt_cells):
+            row, col = divmod(home, cols)
+            for r in range(max(row - reach, 0), min(row + reach, self.rows - 1) + 1):
+                for c in range(max(col - reach, 0), min(col + reach, cols - 1) + 1):
+                    if self.target[r * cols + c] == number:
+                        self.around.append(r * cols + c)
+        self.rebuilds += 1
+
+    def update(self, players):
+        """Once per tick before the plastics move: rebuild when due and lay out this tick's directions."""
+        living = [player for player in players if player.health > 0] or list(players)
+        self.centers = [target.rect.center for target in living]
+        self.points = [pygame.Vector2(center) for center in self.centers]
+        if living != self.targets or self._moved():
+            self.rebuild(living, self.centers)
+
+        self.count, self.counting = self.counting, [0] * len(self.counting)
+        self._separate()
+        self.crowding = None
+        self.tick_arrays = None
+
+    def _moved(self):
+        """Whether a player has left its cell or moved further than the slack since the last rebuild."""
+        slack = self.slack * self.slack
+        for (x, y), (rx, ry), home in zip(self.centers, self.rebuilt_centers, self.rebuilt_cells):
+            if (x - rx) * (x - rx) + (y - ry) * (y - ry) > slack or self.cell_of(x, y) != home:
+                return True
+        return False
+
+    def _separate(self):
+        """Aim lone plastics near a target and push each crowded cell toward its emptier neighbours."""
+        steer_x, steer_y, vectors, aimed = self.steer_x, self.steer_y, self.vectors, self.aimed
+        for index in self.changed:
+            steer_x[index], steer_y[index] = self.dx[index], self.dy[index]
+            vectors[index] = None
+        changed = self.changed = []
+
+        count, cols, last_col, weight = self.count, self.cols, self.cols - 1, self.separation
+        for index in self.around:
+            if count[index] <= 1:
+                aimed[index] = True
+                vectors[index] = None
+            else:
+                aimed[index] = False
+
+        last = len(count) - 1
+        crowded = self.crowding
+        if crowded is None:
+            crowded = [index for index in compress(range(len(count)), count) if count[index] > 1]
+        for index in crowded:
+            here = count[index]
+            col = index % cols
+            # Edges count as full as this cell, so the screen border doesn't push
+            left = count[index - 1] if col > 0 else here
+            right = count[index + 1] if col < last_col else here
+            up = count[index - cols] if index >= cols else here
+            down = count[index + cols] if index + cols <= last else here
+            gx, gy = left - right, up - down
+            if not (gx or gy):
+                continue
+            length = math.sqrt(gx * gx + gy * gy)
+            x, y = self.dx[index] + gx / length * weight, self.dy[index] + gy / length * weight
+            length = math.sqrt(x * x + y * y)
+            if length > 0:
+                x, y = x / length, y / length
+            steer_x[index], steer_y[index] = x, y
+            vectors[index] = None
+            changed.append(index)
+
+    def count_cells(self, cells):
+        """steer()'s counting for a whole array of moving plastics' cells at once."""
+        counts = np.bincount(cells, minlength=len(self.counting))
+        self.counting = counts.tolist()
+        self.crowding = np.flatnonzero(counts > 1).tolist()
+
+    def grid(self):
+        """The field as NumPy arrays: (steer_x, steer_y, target, aimed, centers)."""
+        if self.tick_arrays is None:
+            # Copies of the plain grid with this tick's few changed cells patched in
+            changed = self.changed
+            steer_x, steer_y = self.plain_x.copy(), self.plain_y.copy()
+            if changed:
+                steer_x[changed] = [self.steer_x[index] for index in changed]
+                steer_y[changed] = [self.steer_y[index] for index in changed]
+            aimed = np.zeros(len(steer_x), bool)
+            aimed[[index for index in self.around if self.aimed[index]]] = True
+            self.tick_arrays = (steer_x, steer_y, aimed)
+        steer_x, steer_y, aimed = self.tick_arrays
+        return steer_x, steer_y, self.nearest, aimed, np.array(self.centers, np.float64)
+
+    def steer(self, rect, pos):
+        """Count a moving plastic in the cell under its rect's center and return its unit direction.
+
+        pos is its exact position as a Vector2, used to aim straight at a
+        nearby target. None if it is on top of that target. The Vector2 may
+        be shared with the rest of the cell, so it must not be changed.
+        """
+        # cell_of(), inlined since this runs once per plastic
+        x, y = rect.center
+        i, j = x + self.margin, y + self.margin
+        if 0 <= i < self.lut_size > j >= 0:
+            index = self.row_list[j] + self.col_list[i]
+        else:
+            index = self.cell_of(x, y)
+        self.counting[index] += 1
+        vector = self.vectors[index]
+        if vector is not None:
+            return vector
+        if not self.aimed[index]:
+            # First plastic in this cell since its direction changed
+            vector = self.vectors[index] = pygame.Vector2(self.steer_x[index], self.steer_y[index])
+            return vector
+
+        direction = self.points[self.target[index]] - pos
+        if direction.length_squared() <= 1:
+            return None
+        direction.normalize_ip()
+        return direction
@@ -0,0 +1,47 @@
+import pygame
+from collections import OrderedDict
+
+class FontRegistry:
+    """One Font object per (name, size), created on first use."""
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, size, name=None):
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+
+class TextCache:
+    """Rendered text surfaces keyed by (text, size, colour), with LRU eviction."""
+    def __init__(self, font_registry, max_entries=256):
+        self.font_registry = font_registry
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, size, color, name=None):
+        """Return the shared surface for text, rendering it only on a miss."""
+        key = (text, size, tuple(color), name)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font_registry.get(size, name).render(text, True, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def stats(self):
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+# Shared instances
+fonts = FontRegistry()
+text_cache = TextCache(fonts)
@@ -0,0 +1,56 @@
+import pygame
+from engine.Fonts import text_cache
+
+class Hud:
+    """Health, coin and wave counters that only re-render when their value changes."""
+    def __init__(self, coin_image, font_size=30, color=(255, 255, 255)):
+        self.coin_image = coin_image
+        self.font_size = font_size
+        self.color = color
+        self.counters = {}  # key -> (value, rendered surface)
+        self.icons = {}  # character image -> 30x30 copy
+
+    def _counter(self, key, value, fmt):
+        cached = self.counters.get(key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        surface = text_cache.render(fmt.format(value), self.font_size, self.color)
+        self.counters[key] = (value, surface)
+        return surface
+
+    def _icon(self, image):
+        icon = self.icons.get(image)
+        if icon is None:
+            icon = pygame.transform.scale(image, (30, 30))
+            self.icons[image] = icon
+        return icon
+
+    # Each draw method returns the rects it touched for dirty-rect rendering
+
+    def draw_health(self, screen, turtle, crab):
+        rects = []
+        for character, x, y in ((turtle, 10, 10), (crab, 10, 50)):
+            image = self._icon(character.original_image)
+            rects.append(screen.blit(image, (x, y)))
+            health_text = self._counter((character, "health"), character.health, "{}")
+            text_x = x + image.get_width() + 10
+            text_y = y + (image.get_height() - health_text.get_height()) // 2
+            rects.append(screen.blit(health_text, (text_x, text_y)))
+        return rects
+
+    def draw_coins(self, screen, coin_count):
+        coin_x, coin_y = 700, 10
+        coin_rect = screen.blit(self.coin_image, (coin_x, coin_y))
+        coin_text = self._counter("coins", coin_count, "{:04d}")
+        text_x = coin_x + self.coin_image.get_width() + 5
+        text_y = coin_y + (self.coin_image.get_height() - coin_text.get_height()) // 2
+        return [coin_rect, screen.blit(coin_text, (text_x, text_y))]
+
+    def draw_wave(self, screen, wave_number):
+        wave_text = self._counter("wave", wave_number, "Wave: {:02d}")
+        return [screen.blit(wave_text, (700, 50))]
+
+    def draw(self, screen, turtle, crab, coin_count, wave_number):
+        return (self.draw_health(screen, turtle, crab)
+                + self.draw_coins(screen, coin_count)
+                + self.draw_wave(screen, wave_number))
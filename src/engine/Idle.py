@@ -0,0 +1,47 @@
+import sys
+import asyncio
+import pygame
+
+IDLE_WAIT_MS = 500  # Longest an idle screen blocks before looking again
+WEB_IDLE_FPS = 15  # The browser can't block, it polls this often instead
+WEB = sys.platform == "emscripten"
+
+# Window events that mean the screen has to be drawn again
+REDRAW_EVENTS = {pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED}
+
+class IdleScreen:
+    """For screens that only change on input: draw once, then sleep until an event arrives.
+
+    The caller redraws while dirty is set (on entering the screen, after an
+    expose or on any input it cares about), calls drawn(), and awaits wait()
+    instead of ticking at the frame cap.
+    """
+    def __init__(self):
+        self.dirty = True
+        self.redraws = 0
+        self.waits = 0
+
+    def invalidate(self):
+        self.dirty = True
+
+    def drawn(self):
+        self.dirty = False
+        self.redraws += 1
+
+    def watch(self, event):
+        """Mark the screen dirty if event means the window lost its contents."""
+        if event.type in REDRAW_EVENTS:
+            self.dirty = True
+
+    async def wait(self):
+        """Block until there is an event or IDLE_WAIT_MS passes, leaving any events queued."""
+        self.waits += 1
+        if WEB:
+            await asyncio.sleep(1 / WEB_IDLE_FPS)
+            return
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        if event.type != pygame.NOEVENT:
+            # Put it back in front of anything that arrived since, for the screen's own event loop
+            pending = pygame.event.get()
+            for queued in [event] + pending:
+                pygame.event.post(queued)
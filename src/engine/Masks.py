@@ -0,0 +1,40 @@
+import weakref
+import pygame
+from engine.RotationCache import rotations
+
+class MaskCache:
+    """Collision masks of shared surfaces, each built once.
+
+    Rotated sprites blit the rotation cache's quantized surfaces, so a mask
+    per surface is a mask per image and angle. Entries go away with their
+    surface, so rotations evicted from the rotation cache don't pile up here.
+    """
+    def __init__(self):
+        self.masks = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, surface):
+        mask = self.masks.get(surface)
+        if mask is not None:
+            self.hits += 1
+            return mask
+        self.misses += 1
+        mask = self.masks[surface] = pygame.mask.from_surface(surface)
+        return mask
+
+    def warm(self, surface):
+        """Build the masks of every quantized rotation of surface up front."""
+        for angle in range(0, 360, rotations.step):
+            self.get(rotations.get(surface, angle).image)
+
+    def stats(self):
+        return {"masks": len(self.masks), "hits": self.hits, "misses": self.misses}
+
+# Shared instance
+masks = MaskCache()
+
+def masks_overlap(a, b):
+    """Whether two sprites' opaque pixels touch, a narrow phase for after a rect test passes."""
+    offset = (b.rect.x - a.rect.x, b.rect.y - a.rect.y)
+    return masks.get(a.image).overlap(masks.get(b.image), offset) is not None
@@ -0,0 +1,77 @@
+import time
+from collections import deque
+
+class PhaseTimer:
+    """Wall time spent in each named phase of a frame, kept for the last few frames.
+
+    Code calls lap(phase) at the end of each phase; the time since the
+    previous lap is added to that phase, so phases that run several times
+    per frame (one sim step each) add up.
+    """
+    def __init__(self, history=None):
+        self.frames = deque(maxlen=history)  # One {phase: ms} dict per finished frame
+        self.current = {}
+        self.last = time.perf_counter()
+
+    def begin_frame(self):
+        self.current = {}
+        self.last = time.perf_counter()
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0) + (now - self.last) * 1000
+        self.last = now
+
+    def end_frame(self):
+        self.frames.append(self.current)
+
+    def phases(self, detail=False):
+        """Phase names in the order they first ran.
+
+        Detailed phases are named "phase.part" and roll up into "phase"
+        unless detail is set.
+        """
+        names = {}
+        for frame in self.frames:
+            for name in frame:
+                names[name if detail else name.split(".")[0]] = None
+        return list(names)
+
+    def samples(self, phase):
+        """Milliseconds per frame for a phase and its parts, 0 on frames where it didn't run."""
+        if phase == "frame":
+            return [sum(frame.values()) for frame in self.frames]
+        prefix = phase + "."
+        return [sum(ms for name, ms in frame.items() if name == phase or name.startswith(prefix))
+                for frame in self.frames]
+
+    def summary(self, detail=False):
+        """Mean, p95 and p99 milliseconds for every phase and the whole frame."""
+        return {phase: summarize(self.samples(phase)) for phase in self.phases(detail) + ["frame"]}
+
+class NullTimer:
+    """Stands in for a PhaseTimer when nothing is being measured."""
+    def begin_frame(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def end_frame(self):
+        pass
+
+null_timer = NullTimer()
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of an unsorted list."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def summarize(samples):
+    if not samples:
+        return {"mean": 0, "p95": 0, "p99": 0}
+    return {
+        "mean": sum(samples) / len(samples),
+        "p95": percentile(samples, 0.95),
+        "p99": percentile(samples, 0.99),
+    }
@@ -0,0 +1,198 @@
+import pygame
+from engine.Rng import rng
+
+# NumPy is optional, without it plastics fall back to updating themselves one by one
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class PlasticStore:
+    """Struct-of-arrays storage for plastics, stepped in one vectorized pass per tick.
+
+    Positions, speeds, health and blink timers live in NumPy arrays indexed by
+    slot. The Plastic sprites stay in their group as thin views: the store
+    writes their pos, rect, hitbox and visibility back after each step so
+    drawing and collision code keep working on sprites.
+    """
+    available = np is not None
+
+    # (name, per-slot shape, dtype) of every array
+    FIELDS = (
+        ("pos", (2,), "float64"),
+        ("speed", (), "float64"),
+        ("health", (), "int64"),
+        ("blinking", (), "bool"),
+        ("blink_elapsed", (), "float64"),
+        ("blink_duration", (), "float64"),
+        ("blink_interval", (), "float64"),
+        ("width", (), "int64"),
+        ("half_width", (), "int64"),
+        ("target", (), "int64"),
+    )
+
+    def __init__(self, capacity=256):
+        self.capacity = 0
+        self.count = 0  # Slots in use are 0..count-1, kept dense so every pass is a plain slice
+        self.sprites = []
+        self.targets = []  # Distinct target sprites, slots refer to them by index
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        for name, shape, dtype in self.FIELDS:
+            grown = np.zeros((capacity,) + shape, dtype)
+            if self.capacity:
+                grown[:self.capacity] = getattr(self, name)
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def attach(self, plastic):
+        """Move a plastic's state into the arrays, from now on it reads and writes them."""
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        slot = self.count
+        self.count += 1
+        self.sprites.append(plastic)
+
+        if plastic.target not in self.targets:
+            self.targets.append(plastic.target)
+        self.target[slot] = self.targets.index(plastic.target)
+        self.pos[slot] = plastic.pos
+        self.speed[slot] = plastic._speed
+        self.health[slot] = plastic._health
+        self.blinking[slot] = plastic._blinking
+        self.blink_elapsed[slot] = plastic._blink_elapsed
+        self.blink_duration[slot] = plastic.blink_duration
+        self.blink_interval[slot] = plastic.blink_interval
+        self.width[slot] = plastic.rect.width
+        self.half_width[slot] = plastic.rect.width // 2
+        plastic.store, plastic.slot = self, slot
+
+    def detach(self, plastic):
+        """Copy a plastic's state back to the sprite and free its slot."""
+        slot = plastic.slot
+        plastic.store, plastic.slot = None, -1
+        plastic._speed = float(self.speed[slot])
+        plastic._health = int(self.health[slot])
+        plastic._blinking = bool(self.blinking[slot])
+        plastic._blink_elapsed = float(self.blink_elapsed[slot])
+
+        # Keep slots dense by moving the last one into the hole
+        last = self.count - 1
+        if slot != last:
+            moved = self.sprites[last]
+            self.sprites[slot] = moved
+            moved.slot = slot
+            for name, _, _ in self.FIELDS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+        self.sprites.pop()
+        self.count = last
+
+    def step(self, dt, flow=None):
+        """Blink, steer along the flow field (or at each plastic's target without one) and cull every stored plastic in one pass."""
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+
+        # Blinking: plastics are stunned while they blink and toggle visibility
+        blinking = self.blinking[:n]
+        toggled = []
+        if blinking.any():
+            elapsed = self.blink_elapsed[:n]
+            elapsed[blinking] += dt
+            done = blinking & (elapsed > self.blink_duration[:n])
+            blinking[done] = False
+            visible = ~blinking | ((elapsed / self.blink_interval[:n] + 1e-6).astype(np.int64) % 2 == 0)
+            toggled = np.flatnonzero(blinking | done).tolist()
+        everyone = not blinking.any()  # Most ticks nothing blinks and whole arrays stand in for the masks
+
+        moving = ~blinking
+        if flow is None:
+            direction, stuck = self._aim(pos, moving)
+        else:
+            direction, stuck = self._follow(flow, pos, moving)
+        # Apply a small nudge towards the target to prevent getting stuck,
+        # a random diagonal drawn from the shared generator
+        if len(stuck):
+            nbits = 2 * len(stuck)
+            raw = rng.getrandbits(nbits).to_bytes((nbits + 7) // 8, "little")
+            bits = np.unpackbits(np.frombuffer(raw, np.uint8), bitorder="little")[:nbits]
+            direction[stuck] = (bits.reshape(-1, 2) * 2.0 - 1) * 0.7071067811865476
+        if everyone:
+            pos += direction * self.speed[:n, None] * dt
+        else:
+            pos[moving] += direction[moving] * self.speed[:n, None][moving] * dt
+
+        # Rect centers, rounded the way Rect rounds float positions
+        center = np.floor(np.abs(pos) + 0.5) * np.sign(pos)
+
+        # Off-screen culling
+        offscreen = moving & (center[:, 0] - self.half_width[:n] + self.width[:n] < 0)
+
+        # Write the results back to the sprites for drawing and collisions
+        sprites = self.sprites
+        if everyone:
+            movers, moved_pos, moved_center = sprites, pos, center
+        else:
+            moved = np.flatnonzero(moving)
+            movers, moved_pos, moved_center = [sprites[slot] for slot in moved.tolist()], pos[moved], center[moved]
+        for sprite, xy, cxy in zip(movers, moved_pos.tolist(), moved_center.astype(np.int64).tolist()):
+            sprite.pos.update(xy)
+            sprite.rect.center = sprite.hitbox.center = cxy
+        for slot in toggled:
+            sprites[slot].visible = bool(visible[slot])
+        for sprite in [sprites[slot] for slot in np.flatnonzero(offscreen).tolist()]:
+            sprite.kill()
+
+    def _aim(self, pos, moving):
+        """Unit directions toward each plastic's own target, and the slots already on top of it."""
+        centers = np.array([target.rect.center for target in self.targets], dtype=np.float64)
+        direction = centers[self.target[:len(pos)]] - pos
+        length = np.sqrt(direction[:, 0] * direction[:, 0] + direction[:, 1] * direction[:, 1])
+        far = moving & (length > 1)
+        direction[far] /= length[far, None]
+        return direction, np.flatnonzero(moving & ~far)
+
+    def _follow(self, flow, pos, moving):
+        """FlowField.steer() for every plastic at once, with the same arithmetic in the same order."""
+        # Cells of the rect centers, rounded the way Rect rounds float positions
+        cell = flow.cells_of((np.floor(np.abs(pos) + 0.5) * np.sign(pos)).astype(np.int64))
+        flow.count_cells(cell[moving])
+        steer_x, steer_y, target, aimed, centers = flow.grid()
+        direction = np.empty_like(pos)
+        direction[:, 0] = steer_x[cell]
+        direction[:, 1] = steer_y[cell]
+
+        # Alone near their target: straight at it
+        close = np.flatnonzero(aimed[cell] & moving)
+        aim = centers[target[cell[close]]] - pos[close]
+        length = np.sqrt(aim[:, 0] * aim[:, 0] + aim[:, 1] * aim[:, 1])
+        far = length > 1
+        direction[close[far]] = aim[far] / length[far, None]
+        return direction, close[~far]
+
+class PlasticGroup(pygame.sprite.Group):
+    """Sprite group that keeps its plastics in a PlasticStore and updates them in bulk."""
+    def __init__(self, store, *sprites):
+        self.store = store
+        self.spawners = []  # Bosses still need their own per-object update
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.store.attach(sprite)
+        if hasattr(sprite, "update_spawner"):
+            self.spawners.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.store.detach(sprite)
+        if sprite in self.spawners:
+            self.spawners.remove(sprite)
+
+    def update(self, dt, flow=None):
+        self.store.step(dt, flow)
+        for boss in list(self.spawners):
+            boss.update_spawner(dt)
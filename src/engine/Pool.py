@@ -0,0 +1,66 @@
+import pygame
+
+class Pooled:
+    """Mixin for sprites that go back to their Pool when they leave their last group.
+
+    Pooled classes split construction into allocate(), which creates the
+    rects and vectors once, and reset(*args), which sets all per-use state.
+    """
+    pool = None
+
+    @classmethod
+    def blank(cls):
+        """An allocated instance with no state yet, used to prewarm pools."""
+        sprite = cls.__new__(cls)
+        pygame.sprite.Sprite.__init__(sprite)
+        sprite.allocate()
+        return sprite
+
+    def kill(self):
+        # Sprite.kill() clears the groups without calling remove_internal()
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        if not self.alive() and self.pool is not None:
+            self.pool.release(self)
+
+class Pool:
+    """Recycles killed sprites of one Pooled class instead of allocating new ones."""
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+        self.live = 0
+        self.high_water = 0  # Most sprites live at once
+        self.created = 0
+
+    def acquire(self, *args):
+        """Same arguments as the class constructor, reuses a free sprite when there is one."""
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+        else:
+            sprite = self.cls(*args)
+            sprite.pool = self
+            self.created += 1
+        self.live += 1
+        self.high_water = max(self.high_water, self.live)
+        return sprite
+
+    def release(self, sprite):
+        self.live -= 1
+        self.free.append(sprite)
+
+    def prewarm(self, count):
+        """Allocate free sprites until count are available without allocating."""
+        while len(self.free) < count:
+            sprite = self.cls.blank()
+            sprite.pool = self
+            self.created += 1
+            self.free.append(sprite)
+
+    def stats(self):
+        return {"live": self.live, "free": len(self.free), "high_water": self.high_water, "created": self.created}
@@ -0,0 +1,100 @@
+import pygame
+from engine.PhaseTimer import PhaseTimer, null_timer
+from engine.AssetCache import assets
+from engine.RotationCache import rotations
+from engine.Fonts import fonts, text_cache
+from engine.TextLayout import paragraphs
+from engine.EffectCache import effects
+
+GRAPH_FRAMES = 120  # Frames shown in the rolling graph
+GRAPH_HEIGHT = 50
+GRAPH_MS = 33.3  # Frame time at the top of the graph
+BUDGET_MS = 1000 / 60  # Line drawn across the graph
+REFRESH_SECONDS = 0.25  # How often the numbers are re-rendered
+
+def cache_misses():
+    """Misses in the shared caches so far, each one built a surface the cache then kept."""
+    return assets.misses + rotations.misses + text_cache.misses + paragraphs.misses + effects.misses
+
+class ProfilerOverlay:
+    """Frame-time graph, per-phase milliseconds and entity counts, toggled with F3.
+
+    While the overlay is hidden, timer is the shared NullTimer, so the
+    lap() calls left in the main loop and World.step() cost one empty
+    method call each.
+    """
+    def __init__(self, pos=(510, 90), width=280, font_size=16, color=(255, 255, 255)):
+        self.phase_timer = PhaseTimer(history=GRAPH_FRAMES)
+        self.timer = null_timer
+        self.enabled = False
+        self.pos = pos
+        self.width = width
+        self.font = fonts.get(font_size)
+        self.color = color
+        self.rows = []  # (label surface, value surface), re-rendered every REFRESH_SECONDS
+        self.panel = None
+        self.refresh_timer = 0
+        self.misses = 0
+
+    def toggle(self):
+        """Show or hide the overlay and return the timer to hand to the World."""
+        self.enabled = not self.enabled
+        self.timer = self.phase_timer if self.enabled else null_timer
+        self.phase_timer.frames.clear()
+        self.refresh_timer = REFRESH_SECONDS  # Fill in the numbers on the first frame shown
+        self.misses = cache_misses()
+        return self.timer
+
+    def _row(self, label, value):
+        # The overlay's text changes every refresh, so it bypasses the shared text cache
+        self.rows.append((self.font.render(label, True, self.color), self.font.render(value, True, self.color)))
+
+    def _refresh(self, world, elapsed):
+        self.rows = []
+        summary = self.phase_timer.summary(detail=True)
+        frame = summary.pop("frame")
+        self._row("frame", f"{frame['mean']:.2f} ms  p99 {frame['p99']:.2f}")
+        for phase, stats in summary.items():
+            self._row("  " + phase, f"{stats['mean']:.2f} ms")
+
+        for name, group in (("plastics", world.plastic_group), ("turtle bullets", world.turtle_bullets),
+                            ("crab bullets", world.crab_bullets), ("players", world.player_sprites)):
+            self._row(name, str(len(group)))
+        budget = world.budget
+        self._row("minions deferred / dropped", f"{budget.deferred} / {budget.dropped}")
+
+        misses = cache_misses()
+        self._row("cache misses", f"{misses}  +{(misses - self.misses) / elapsed:.0f}/s")
+        self.misses = misses
+
+        height = GRAPH_HEIGHT + 10 + len(self.rows) * self.font.get_linesize()
+        self.panel = pygame.Surface((self.width, height), pygame.SRCALPHA)
+        self.panel.fill((0, 0, 0, 160))
+
+    def draw(self, screen, world, frame_time):
+        """Draw the overlay and return the rect it covers."""
+        self.refresh_timer += frame_time
+        if self.panel is None or self.refresh_timer >= REFRESH_SECONDS:
+            self._refresh(world, max(self.refresh_timer, 1e-6))
+            self.refresh_timer = 0
+
+        x, y = self.pos
+        rect = screen.blit(self.panel, self.pos)
+
+        # Rolling graph of the work done each frame, one column per frame
+        bottom = y + 5 + GRAPH_HEIGHT
+        column = (self.width - 10) / GRAPH_FRAMES
+        for i, ms in enumerate(self.phase_timer.samples("frame")):
+            height = min(ms / GRAPH_MS, 1) * GRAPH_HEIGHT
+            color = (0, 220, 0) if ms < BUDGET_MS else (240, 60, 60)
+            left = x + 5 + i * column
+            pygame.draw.line(screen, color, (left, bottom), (left, bottom - height))
+        budget_y = bottom - BUDGET_MS / GRAPH_MS * GRAPH_HEIGHT
+        pygame.draw.line(screen, (255, 255, 0), (x + 5, budget_y), (x + self.width - 5, budget_y))
+
+        row_y = bottom + 5
+        for label, value in self.rows:
+            screen.blit(label, (x + 5, row_y))
+            screen.blit(value, (x + self.width - 5 - value.get_width(), row_y))
+            row_y += self.font.get_linesize()
+        return rect
@@ -0,0 +1,66 @@
+from collections import deque
+
+BUDGET_MS = 1000 / 60  # Work a frame may take at full quality
+
+# Quality tiers, best first, each giving up one more thing than the one above
+TIERS = (
+    {"name": "full", "blink_flash": True, "debug_hitbox": True, "crosshair_smoothing": True, "render_divisor": 1},
+    {"name": "no_flash", "blink_flash": False, "debug_hitbox": True, "crosshair_smoothing": True, "render_divisor": 1},
+    {"name": "no_hitbox", "blink_flash": False, "debug_hitbox": False, "crosshair_smoothing": True, "render_divisor": 1},
+    {"name": "no_smoothing", "blink_flash": False, "debug_hitbox": False, "crosshair_smoothing": False, "render_divisor": 1},
+    {"name": "half_rate", "blink_flash": False, "debug_hitbox": False, "crosshair_smoothing": False, "render_divisor": 2},
+    {"name": "third_rate", "blink_flash": False, "debug_hitbox": False, "crosshair_smoothing": False, "render_divisor": 3},
+)
+
+class QualityGovernor:
+    """Steps quality down when frames go over budget and back up when there is headroom.
+
+    Fed the work each frame took (clock.get_rawtime(), so the render cap's
+    sleep doesn't count). A tier with render_divisor n draws a frame per n
+    sim steps, so its frames get n times the budget. Every change waits for
+    a fresh window of samples, so one slow frame can't bounce the tier.
+    """
+    def __init__(self, budget_ms=BUDGET_MS, window=60, headroom=0.6, log=None):
+        self.budget_ms = budget_ms
+        self.samples = deque(maxlen=window)
+        self.headroom = headroom  # Step up only if the better tier would use under this much of its budget
+        self.log = log  # Told about each tier change, main sets it for --timing and --stats
+        self.tier = 0
+        self.changes = []  # (from tier, to tier, reason)
+
+    @property
+    def settings(self):
+        return TIERS[self.tier]
+
+    def frame_budget(self, tier):
+        return self.budget_ms * TIERS[tier]["render_divisor"]
+
+    def observe(self, frame_ms):
+        """Add one frame's work in milliseconds, returns True if the tier changed."""
+        samples = self.samples
+        samples.append(frame_ms)
+        if len(samples) < samples.maxlen:
+            return False
+
+        mean = sum(samples) / len(samples)
+        if mean > self.frame_budget(self.tier) and self.tier < len(TIERS) - 1:
+            return self._change(self.tier + 1, f"mean frame {mean:.1f}ms over {self.frame_budget(self.tier):.1f}ms budget")
+        if self.tier > 0:
+            # Drawing more often costs more per sim second, scale the estimate to match
+            better = self.tier - 1
+            estimate = mean * TIERS[self.tier]["render_divisor"] / TIERS[better]["render_divisor"]
+            if estimate < self.frame_budget(better) * self.headroom:
+                return self._change(better, f"mean frame {mean:.1f}ms leaves headroom")
+        return False
+
+    def _change(self, tier, reason):
+        self.changes.append((self.tier, tier, reason))
+        if self.log is not None:
+            self.log(f"Quality: {TIERS[self.tier]['name']} -> {TIERS[tier]['name']} ({reason})")
+        self.tier = tier
+        self.samples.clear()
+        return True
+
+    def reset(self):
+        """Forget the samples, for when frames stop being comparable (a pause or a menu)."""
+        self.samples.clear()
@@ -0,0 +1,127 @@
+import struct
+import zlib
+import pygame
+from engine.World import HeldKeys
+
+MAGIC = b"OCNREC1\n"
+HEADER = struct.Struct("<QH")  # Seed, sim steps per second
+
+# Record kinds, each a one-byte tag followed by its fields
+TICK = 0  # Inputs of one sim step
+START_WAVE = 1
+RESET = 2
+BUY = 3  # Shop purchase, followed by the item key
+END = 4  # Outcome of the recorded session, checked by replays
+SMOOTHING = 5  # Crosshair smoothing switched by the quality governor
+
+FIELDS = {
+    TICK: struct.Struct("<hhBBhh"),  # Mouse x, y, held keys, flags, shot target x, y
+    START_WAVE: struct.Struct("<"),
+    RESET: struct.Struct("<H"),  # Wave number
+    BUY: struct.Struct("<B"),  # Length of the item key that follows
+    END: struct.Struct("<IiHhhIH"),  # See outcome()
+    SMOOTHING: struct.Struct("<B"),  # On or off
+}
+
+# The only keys World reads from held key state (crab movement)
+RECORDED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+SHOOT = 1
+CRAB_SHOOT = 2
+
+def outcome(world):
+    """The state a replay has to reproduce to count as identical."""
+    return (world.ticks, world.coin_count, world.wave_number, world.turtle.health, world.crab.health,
+            world.total_plastic_spawned, len(world.plastic_group))
+
+class InputRecorder:
+    """Logs everything fed to a World, one record per sim step, to a compact file.
+
+    Together with the seed of the shared generator that is enough to
+    replay the session exactly (see replay.py).
+    """
+    def __init__(self, path, seed, hz):
+        self.path = path
+        self.seed = seed
+        self.hz = hz
+        self.data = bytearray()
+
+    def _write(self, kind, *fields):
+        self.data.append(kind)
+        self.data += FIELDS[kind].pack(*fields)
+
+    def tick(self, inputs):
+        """Record the inputs of the sim step about to run, call just before World.step()."""
+        keys = 0
+        for bit, key in enumerate(RECORDED_KEYS):
+            if inputs.keys[key]:
+                keys |= 1 << bit
+        flags = 0
+        shoot_x = shoot_y = 0
+        if inputs.shoot_at is not None:
+            flags |= SHOOT
+            shoot_x, shoot_y = inputs.shoot_at
+        if inputs.crab_shoot:
+            flags |= CRAB_SHOOT
+        self._write(TICK, int(inputs.mouse_pos[0]), int(inputs.mouse_pos[1]), keys, flags, shoot_x, shoot_y)
+
+    def start_wave(self):
+        self._write(START_WAVE)
+
+    def reset(self, wave_number=1):
+        self._write(RESET, wave_number)
+
+    def buy(self, item_key):
+        key = item_key.encode()
+        self._write(BUY, len(key))
+        self.data += key
+
+    def smoothing(self, on):
+        self._write(SMOOTHING, on)
+
+    def close(self, world):
+        """Append the final outcome and write the file."""
+        self._write(END, *outcome(world))
+        with open(self.path, "wb") as file:
+            file.write(MAGIC + HEADER.pack(self.seed, self.hz) + zlib.compress(bytes(self.data), 9))
+
+class InputLog:
+    """A recording read back as a list of (kind, ...) records."""
+    def __init__(self, seed, hz, records, outcome):
+        self.seed = seed
+        self.hz = hz
+        self.records = records
+        self.outcome = outcome  # None if the recording was cut short
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            raw = file.read()
+        if not raw.startswith(MAGIC):
+            raise ValueError(f"{path} is not an input recording")
+        seed, hz = HEADER.unpack_from(raw, len(MAGIC))
+        data = zlib.decompress(raw[len(MAGIC) + HEADER.size:])
+
+        records = []
+        key_states = {}  # Held-key bitmask -> shared HeldKeys
+        final = None
+        offset = 0
+        while offset < len(data):
+            kind = data[offset]
+            fields = FIELDS[kind].unpack_from(data, offset + 1)
+            offset += 1 + FIELDS[kind].size
+            if kind == TICK:
+                mouse_x, mouse_y, keys, flags, shoot_x, shoot_y = fields
+                held = key_states.get(keys)
+                if held is None:
+                    held = key_states[keys] = HeldKeys(*[key for bit, key in enumerate(RECORDED_KEYS) if keys >> bit & 1])
+                shoot_at = (shoot_x, shoot_y) if flags & SHOOT else None
+                records.append((TICK, (mouse_x, mouse_y), held, shoot_at, bool(flags & CRAB_SHOOT)))
+            elif kind == BUY:
+                records.append((BUY, data[offset:offset + fields[0]].decode()))
+                offset += fields[0]
+            elif kind == END:
+                final = fields
+            else:
+                records.append((kind,) + fields)
+        return cls(seed, hz, records, final)
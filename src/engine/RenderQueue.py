@@ -0,0 +1,71 @@
+import pygame
+from operator import itemgetter
+
+# Draw order, lowest first
+BULLETS = 0
+PLAYERS = 1
+PLASTICS = 2
+HUD = 3
+CROSSHAIR = 4
+
+_layer = itemgetter(0)
+
+class RenderQueue:
+    """Everything a frame draws, collected from every system and submitted in one Surface.blits() call.
+
+    Entries are (layer, surface, position, area). flush() sorts them by
+    layer once, stably, so each layer keeps the order it was queued in.
+    Sprites are queued by identity, so an entity queued twice in a frame
+    is still drawn once.
+    """
+    def __init__(self):
+        self.entries = []
+        self.queued = set()  # Sprites queued this frame
+        self.layer = 0  # Layer blit() queues on
+        self.duplicates = 0  # Sprites queued more than once, and skipped
+        self.last_count = 0  # Blits in the last flush
+
+    def add(self, surface, pos, layer, area=None):
+        self.entries.append((layer, surface, pos, area))
+
+    def add_sprite(self, sprite, layer, image=None):
+        """Queue a sprite's image, or another surface in its place, at its rect."""
+        if sprite in self.queued:
+            self.duplicates += 1
+            return
+        self.queued.add(sprite)
+        self.entries.append((layer, image or sprite.image, sprite.rect, None))
+
+    def add_sprites(self, sprites, layer):
+        for sprite in sprites:
+            self.add_sprite(sprite, layer)
+
+    def on(self, layer):
+        """Set the layer blit() queues on, so helpers written against a Surface (Hud) can draw into the queue."""
+        self.layer = layer
+        return self
+
+    def blit(self, surface, pos, area=None):
+        """Surface.blit() stand-in, queues on the current layer and returns the rect it will cover."""
+        self.entries.append((self.layer, surface, pos, area))
+        return pygame.Rect(pos, area.size if area is not None else surface.get_size())
+
+    def flush(self, target):
+        """Draw everything queued in layer order with one blits() call and return the rects drawn."""
+        entries = self.entries
+        entries.sort(key=_layer)
+        rects = target.blits([entry[1:] for entry in entries])
+        self.last_count = len(entries)
+        self.entries = []
+        self.queued.clear()
+        return rects
+
+def queue_world(queue, world, flash=True):
+    """Queue the world's bullets, players and plastics, each exactly once (not the crosshair)."""
+    queue.add_sprites(world.turtle_bullets, BULLETS)
+    queue.add_sprites(world.crab_bullets, BULLETS)
+    queue.add_sprites(world.player_sprites, PLAYERS)
+    for plastic in world.plastic_group:
+        image = plastic.frame_image(flash)
+        if image is not None:
+            queue.add_sprite(plastic, PLASTICS, image)
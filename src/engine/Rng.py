@@ -0,0 +1,12 @@
+import random
+
+# Every gameplay random draw goes through this one generator, so seeding
+# it makes a run repeatable (recordings, replays, benchmarks)
+rng = random.Random()
+
+def reseed(seed=None):
+    """Seed the shared generator, with a fresh seed if none is given, and return the seed used."""
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    rng.seed(seed)
+    return seed
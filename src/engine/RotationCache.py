@@ -0,0 +1,92 @@
+import pygame
+import time
+from collections import OrderedDict
+
+# Angular resolution of cached rotations in degrees (2 or 5 both look fine)
+ROTATION_STEP = 2
+# Upper bound on the pixel memory held by rotated surfaces
+ROTATION_CACHE_BYTES = 32 * 1024 * 1024
+
+class Rotation:
+    """A cached rotated surface together with its rect."""
+    __slots__ = ("image", "rect", "nbytes")
+
+    def __init__(self, image):
+        self.image = image
+        self.rect = image.get_rect()
+        # Width, not pitch, so a frame of a baked sprite sheet doesn't count the whole row
+        self.nbytes = image.get_width() * image.get_bytesize() * image.get_height()
+
+class RotationCache:
+    """Rotated variants of shared surfaces, quantized to a fixed angular step."""
+    def __init__(self, step=ROTATION_STEP, max_bytes=ROTATION_CACHE_BYTES):
+        self.step = step
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # (surface, quantized angle) -> Rotation, oldest first
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Rolling rate of rotations saved per second
+        self._rate_time = time.perf_counter()
+        self._rate_hits = 0
+        self.saved_per_second = 0.0
+
+    def quantize(self, angle):
+        return round(angle / self.step) * self.step % 360
+
+    def get(self, surface, angle):
+        """Return the Rotation of surface nearest to angle (degrees, counter-clockwise)."""
+        key = (surface, self.quantize(angle))
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        return self._add(key, pygame.transform.rotate(surface, key[1]))
+
+    def _add(self, key, image):
+        entry = Rotation(image)
+        self.entries[key] = entry
+        self.bytes += entry.nbytes
+        # Drop least recently used rotations to stay under the memory bound
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, old = self.entries.popitem(last=False)
+            self.bytes -= old.nbytes
+            self.evictions += 1
+        return entry
+
+    def warm(self, surface, frames=None):
+        """Fill every quantized angle of surface up front.
+
+        frames is {angle: rotated surface} from a baked sprite sheet, angles
+        it covers are taken from it instead of being rotated here.
+        """
+        for angle, image in (frames or {}).items():
+            key = (surface, angle)
+            if self.quantize(angle) == angle and key not in self.entries:
+                self._add(key, image)
+        for angle in range(0, 360, self.step):
+            self.get(surface, angle)
+
+    def stats(self):
+        now = time.perf_counter()
+        elapsed = now - self._rate_time
+        if elapsed >= 1.0:
+            self.saved_per_second = (self.hits - self._rate_hits) / elapsed
+            self._rate_time = now
+            self._rate_hits = self.hits
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "memory_bytes": self.bytes,
+            "saved_per_second": self.saved_per_second,
+        }
+
+# Shared instance used by all rotating sprites
+rotations = RotationCache()
@@ -0,0 +1,53 @@
+from collections import defaultdict
+
+class SpatialHash:
+    """Uniform grid of sprites, rebuilt each tick and shared by all collision checks."""
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.order = {}  # sprite -> insertion index, so queries keep group order
+
+    def _cells(self, rect):
+        size = self.cell_size
+        # right/bottom are exclusive, colliderect treats touching edges as a miss
+        x0, x1 = rect.left // size, max(rect.left, rect.right - 1) // size
+        y0, y1 = rect.top // size, max(rect.top, rect.bottom - 1) // size
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def clear(self):
+        self.cells.clear()
+        self.order.clear()
+
+    def insert(self, sprite):
+        """Add a sprite to every cell its rect overlaps."""
+        self.order[sprite] = len(self.order)
+        for cell in self._cells(sprite.rect):
+            self.cells[cell].append(sprite)
+
+    def rebuild(self, sprites):
+        """Re-index all sprites from their current rects."""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def query(self, rect):
+        """Live sprites whose cells overlap rect, in the order they were inserted.
+
+        This is only a broad phase, callers still run their exact rect test.
+        Sprites killed since the last rebuild are skipped so a sprite removed
+        by an earlier hit this tick is never hit again.
+        """
+        cells = self.cells
+        found = set()
+        for cell in self._cells(rect):
+            bucket = cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        if not found:
+            return []
+        return sorted((sprite for sprite in found if sprite.alive()), key=self.order.__getitem__)
+
+    def __len__(self):
+        return len(self.order)
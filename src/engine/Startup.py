@@ -0,0 +1,85 @@
+import time
+import pygame
+from engine.Fonts import text_cache
+
+class StartupTimer:
+    """Milliseconds from process start to each startup step, the first frame and the first interactive frame."""
+    def __init__(self, started):
+        self.started = started  # perf_counter() at the top of main.py
+        self.steps = []  # (name, ms the step took)
+        self.first_frame = None  # ms after start
+        self.interactive = None
+        self._last = started
+
+    def _since_start(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def begin(self):
+        """Start timing a step here, so time spent drawing between steps isn't counted in it."""
+        self._last = time.perf_counter()
+
+    def step(self, name):
+        """Close the step that ran since the previous mark under name."""
+        now = time.perf_counter()
+        self.steps.append((name, (now - self._last) * 1000))
+        self._last = now
+
+    def mark_first_frame(self):
+        if self.first_frame is None:
+            self.first_frame = self._since_start()
+
+    def mark_interactive(self):
+        if self.interactive is None:
+            self.interactive = self._since_start()
+
+    def report(self):
+        lines = [f"  {name:<24}{ms:8.1f} ms" for name, ms in self.steps]
+        if self.interactive is not None:
+            # Loading screen frames, the event loop and drawing the menu
+            lines.append(f"  {'frames in between':<24}{self.interactive - sum(ms for _, ms in self.steps):8.1f} ms")
+        lines.append(f"time to first frame     {self.first_frame or 0:8.1f} ms")
+        lines.append(f"time to interactive     {self.interactive or 0:8.1f} ms")
+        return "\n".join(lines)
+
+class Loader:
+    """Startup work as a list of (label, function), run one per frame so the loading screen keeps drawing."""
+    def __init__(self, steps, timer):
+        self.steps = list(steps)
+        self.timer = timer
+        self.next = 0
+
+    @property
+    def done(self):
+        return self.next >= len(self.steps)
+
+    @property
+    def progress(self):
+        return self.next / len(self.steps) if self.steps else 1.0
+
+    @property
+    def label(self):
+        return "Ready" if self.done else self.steps[self.next][0]
+
+    def run_next(self):
+        label, step = self.steps[self.next]
+        self.timer.begin()
+        step()
+        self.next += 1
+        self.timer.step(label)
+
+def draw_loading_screen(screen, loader, color=(255, 255, 255)):
+    """Title, progress bar and what is loading right now, needs nothing but the default font."""
+    screen.fill((0, 0, 50))
+    width, height = screen.get_size()
+    title = text_cache.render("Loading...", 45, color)
+    screen.blit(title, title.get_rect(center=(width // 2, height // 2 - 50)))
+
+    bar = pygame.Rect(0, 0, width // 2, 20)
+    bar.center = (width // 2, height // 2)
+    pygame.draw.rect(screen, color, bar, 2)
+    filled = bar.inflate(-6, -6)
+    filled.width = int(filled.width * loader.progress)
+    pygame.draw.rect(screen, color, filled)
+
+    label = text_cache.render(loader.label, 24, color)
+    screen.blit(label, label.get_rect(center=(width // 2, height // 2 + 40)))
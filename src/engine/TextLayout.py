@@ -0,0 +1,62 @@
+import pygame
+from collections import OrderedDict
+from engine.Fonts import fonts
+
+def wrap_lines(text, font, max_width):
+    """Split text into lines no wider than max_width, measured with Font.size."""
+    lines = []
+    current_line = []
+    for word in text.split(' '):
+        test_line = ' '.join(current_line + [word])
+        if font.size(test_line)[0] <= max_width or not current_line:
+            current_line.append(word)
+        else:
+            lines.append(' '.join(current_line))
+            current_line = [word]
+    if current_line:
+        lines.append(' '.join(current_line))
+    return lines
+
+class ParagraphCache:
+    """Wrapped, centered paragraphs rendered to one surface each, with LRU eviction.
+
+    Keyed by (text, font, max width, line gap, colour), so a paragraph is
+    laid out and rendered once and then blitted as a single surface.
+    """
+    def __init__(self, font_registry, max_entries=64):
+        self.font_registry = font_registry
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, size, color, max_width, line_gap, name=None):
+        """Return the shared surface for a paragraph, laying it out only on a miss."""
+        key = (text, size, name, max_width, line_gap, tuple(color))
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        font = self.font_registry.get(size, name)
+        lines = [font.render(line, True, color) for line in wrap_lines(text, font, max_width)]
+        width = max(line.get_width() for line in lines)
+        height = sum(line.get_height() for line in lines) + line_gap * (len(lines) - 1)
+        surface = pygame.Surface((width, max(height, 0)), pygame.SRCALPHA)
+        y = 0
+        for line in lines:
+            surface.blit(line, ((width - line.get_width()) // 2, y))
+            y += line.get_height() + line_gap
+
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def stats(self):
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+# Shared instance
+paragraphs = ParagraphCache(fonts)
@@ -0,0 +1,117 @@
+import json
+import os
+from collections import deque
+
+WAVES_PATH = os.path.join("assets", "waves.json")
+
+# Anything the wave file leaves out, these are the original hard-coded rules.
+# Values given as [first, step] grow by step every wave after the first.
+DEFAULTS = {
+    "boss_every": 3,  # Boss appears every 3 waves (change to 5 if you want)
+    "count": [4, 3],  # Plastics per wave, on boss waves the boss is one of them
+    "spawn_interval": 1.0,  # Seconds between regular spawns
+    "speed_multiplier": 1.0,  # Applied on top of the speed each plastic rolls for its wave
+    "boss_health": [150, 50],
+    "boss_speed": 60,  # Pixels per second
+    "minion_interval": 5,  # Seconds between the boss's minion bursts
+}
+
+# Spawn event kinds
+PLASTIC = 0
+BOSS = 1
+
+def per_wave(value, number):
+    """A fixed value, or [first, step] evaluated for a wave number."""
+    if isinstance(value, (list, tuple)):
+        first, step = value
+        return first + step * (number - 1)
+    return value
+
+class WaveDef:
+    """One wave's settings, resolved from the defaults and that wave's overrides."""
+    def __init__(self, number, settings):
+        self.number = number
+        self.boss = settings["boss"]
+        self.count = int(per_wave(settings["count"], number))
+        self.spawn_interval = per_wave(settings["spawn_interval"], number)
+        self.speed_multiplier = per_wave(settings["speed_multiplier"], number)
+        self.boss_health = int(per_wave(settings["boss_health"], number))
+        self.boss_speed = per_wave(settings["boss_speed"], number)
+        self.minion_interval = per_wave(settings["minion_interval"], number)
+
+    def compile(self):
+        """The wave's spawns as a time-ordered queue of (seconds into the wave, kind)."""
+        events = []
+        regular = self.count
+        if self.boss:
+            events.append((0, BOSS))
+            regular -= 1
+        events.extend((self.spawn_interval * (i + 1), PLASTIC) for i in range(regular))
+        return SpawnSchedule(events)
+
+class WaveBook:
+    """Wave definitions from a JSON file: top-level defaults plus per-wave overrides.
+
+        {"count": [4, 3], "boss_every": 3,
+         "waves": {"10": {"count": 60, "spawn_interval": 0.2, "boss": true}}}
+    """
+    def __init__(self, data=None):
+        data = dict(data or {})
+        self.overrides = {int(number): settings for number, settings in data.pop("waves", {}).items()}
+        self.defaults = dict(DEFAULTS, **data)
+        self.waves = {}
+
+    @classmethod
+    def load(cls, path=WAVES_PATH):
+        """Read a wave file, falling back to the defaults if there is none."""
+        if not os.path.exists(path):
+            return cls()
+        with open(path) as file:
+            return cls(json.load(file))
+
+    def wave(self, number):
+        definition = self.waves.get(number)
+        if definition is None:
+            settings = dict(self.defaults, boss=number % self.defaults["boss_every"] == 0)
+            settings.update(self.overrides.get(number, {}))
+            definition = self.waves[number] = WaveDef(number, settings)
+        return definition
+
+    def is_boss_wave(self, number):
+        return self.wave(number).boss
+
+    def total_count(self, through):
+        """Plastics spawned by waves 1 to through, not counting minions."""
+        return sum(self.wave(number).count for number in range(1, through + 1))
+
+class SpawnSchedule:
+    """A compiled wave's spawn events, popped as the wave's clock passes them."""
+    def __init__(self, events):
+        self.events = deque(sorted(events))
+        self.elapsed = 0
+
+    @property
+    def done(self):
+        return not self.events
+
+    def wind(self, dt):
+        """Move the clock on by dt seconds."""
+        self.elapsed += dt
+
+    def due(self):
+        """The kind of the next event if the clock has reached it, else None."""
+        events = self.events
+        # A little slack so a spawn every 1.0s isn't pushed a tick late by float rounding
+        if events and events[0][0] <= self.elapsed + 1e-9:
+            return events[0][1]
+        return None
+
+    def pop(self):
+        """Remove the next event and return its kind."""
+        return self.events.popleft()[1]
+
+    def advance(self, dt):
+        """Move the clock on by dt seconds and yield the kind of every event now due."""
+        self.wind(dt)
+        while self.due() is not None:
+            yield self.pop()
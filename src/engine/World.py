@@ -0,0 +1,274 @@
+import pygame
+from sprites.Turtle import Turtle
+from sprites.Crab import Crab
+from sprites.Plastic import Plastic, PlasticBoss
+from sprites.Bullet import TurtleBullet, CrabBullet
+from sprites.CrossHair import Crosshair
+from engine.SpatialHash import SpatialHash
+from engine.FlowField import FlowField
+from engine.FixedTimestep import snapshot
+from engine.PlasticStore import PlasticStore, PlasticGroup
+from engine.Pool import Pool
+from engine.PhaseTimer import null_timer
+from engine.Waves import WaveBook, BOSS
+from engine.Budget import EntityBudget, DEFER
+from engine.Masks import masks_overlap
+
+# Step plastics in one vectorized NumPy pass instead of one update() call each
+USE_PLASTIC_STORE = PlasticStore.available
+
+# Most plastics alive at once, and what to do with boss minions beyond that (see engine/Budget.py)
+PLASTIC_BUDGET = 400
+BUDGET_POLICY = DEFER
+
+# After a rect test passes, also require the images' opaque pixels to overlap (cached masks).
+# Off by default: hits then need touching pixels, not just touching rects, which changes the game's balance
+MASK_COLLISIONS = False
+
+BULLET_POOL_SIZE = 8  # Bullets kept allocated per shooter, a few screen-crossings of fire
+
+class Inputs:
+    """Player input for a sim step.
+
+    mouse_pos and keys are held state. shoot_at (turtle target) and
+    crab_shoot are one-shot commands, step() consumes them so a click
+    is never applied twice or lost on a frame that runs no sim steps.
+    """
+    def __init__(self, mouse_pos=(400, 300), keys=None):
+        self.mouse_pos = mouse_pos
+        self.keys = keys if keys is not None else NoKeys()
+        self.shoot_at = None
+        self.crab_shoot = False
+
+class NoKeys:
+    """Stands in for key.get_pressed() when nothing is held."""
+    def __getitem__(self, key):
+        return False
+
+class HeldKeys:
+    """Stands in for key.get_pressed() with a fixed set of held keys."""
+    def __init__(self, *keys):
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+class World:
+    """All game state and rules, stepped without ever touching the display.
+
+    main.py draws it and feeds it input; headless tools can drive it
+    directly under the SDL dummy video driver.
+    """
+    def __init__(self, size=(800, 600), use_plastic_store=USE_PLASTIC_STORE, waves=None,
+                 budget=None):
+        self.size = size
+        self.budget = budget if budget is not None else EntityBudget(PLASTIC_BUDGET, BUDGET_POLICY)
+        # Wave definitions, edit assets/waves.json to change counts, speeds and boss waves
+        self.waves = waves if waves is not None else WaveBook.load()
+
+        # Create Sprites
+        self.crosshair = Crosshair((size[0] // 2, size[1] // 2))
+
+        # Create Players
+        self.turtle = Turtle(self.crosshair)
+        self.crab = Crab()
+
+        # Create sprite groups
+        self.player_sprites = pygame.sprite.Group(self.turtle, self.crab)
+        self.turtle_bullets = pygame.sprite.Group()
+        self.crab_bullets = pygame.sprite.Group()
+        self.crosshair_group = pygame.sprite.Group(self.crosshair)
+        if use_plastic_store:
+            self.plastic_group = PlasticGroup(PlasticStore())
+        else:
+            self.plastic_group = pygame.sprite.Group()
+
+        # Sprites whose drawn position is interpolated between sim steps
+        self.moving_groups = (self.player_sprites, self.turtle_bullets, self.crab_bullets,
+                              self.plastic_group, self.crosshair_group)
+
+        # Killed bullets and plastics go back to these and are reused by the next spawn
+        self.turtle_bullet_pool = Pool(TurtleBullet)
+        self.crab_bullet_pool = Pool(CrabBullet)
+        self.plastic_pool = Pool(Plastic)
+        self.turtle.bullet_factory = self.turtle_bullet_pool.acquire
+        self.crab.bullet_factory = self.crab_bullet_pool.acquire
+
+        # Steering for every plastic toward the nearest living player, without NumPy they chase the crab
+        self.players = (self.turtle, self.crab)
+        self.flow = FlowField(size) if FlowField.available else None
+
+        # Broad phase for every check against plastics, rebuilt once per tick
+        self.plastic_hash = SpatialHash(cell_size=64)
+        self.mask_collisions = MASK_COLLISIONS  # Narrow phase, see above
+
+        # Game variables
+        self.coin_count = 0  # Starting coins
+        self.wave_number = 1
+        self.schedule = self.waves.wave(1).compile()  # The current wave's spawns still to come
+        self.total_plastic_spawned = 0
+        self.wave_cleared = False  # Set when the wave is over, cleared by start_wave()
+        self.ticks = 0
+
+        # Swap in a PhaseTimer to measure how long each part of step() takes
+        self.timer = null_timer
+
+    @property
+    def game_over(self):
+        return self.turtle.health <= 0 or self.crab.health <= 0
+
+    def reset(self, wave_number=1):
+        """Start a new game, from wave 1 unless a later wave is given (used by headless tools)."""
+        self.coin_count = 100  # Reset to starting coins
+        self.wave_number = wave_number
+        self.schedule = self.waves.wave(wave_number).compile()
+        self.total_plastic_spawned = self.waves.total_count(wave_number - 1)
+        self.wave_cleared = False
+
+        self.turtle_bullets.empty()
+        self.crab_bullets.empty()
+        self.plastic_group.empty()
+        self.budget.clear()
+        if self.flow is not None:
+            self.flow.reset()
+
+        turtle, crab, crosshair = self.turtle, self.crab, self.crosshair
+        turtle.health = 3
+        crab.health = 3
+
+        turtle.pos = pygame.Vector2(400, 300)
+        crab.pos = pygame.Vector2(200, 200)
+        turtle.rect.center = turtle.pos
+        crab.rect.center = crab.pos
+        turtle.update_hitbox()
+        crab.update_hitbox()
+        turtle.shoot_timer = 0
+        crab.shoot_timer = 0
+
+        crosshair.pos = pygame.Vector2(self.size[0] // 2, self.size[1] // 2)
+        crosshair.rect.center = crosshair.pos
+
+        # Don't interpolate from where the players were in the last game
+        for sprite in (turtle, crab, crosshair):
+            sprite.prev_pos = sprite.pos.copy()
+
+    def prewarm_pools(self):
+        """Allocate everything the current wave will spawn, called from the between-waves screen."""
+        wave = self.waves.wave(self.wave_number)
+        plastics = wave.count
+        if wave.boss:
+            plastics *= 2  # Room for the boss's minions
+        self.plastic_pool.prewarm(plastics)
+        self.turtle_bullet_pool.prewarm(BULLET_POOL_SIZE)
+        self.crab_bullet_pool.prewarm(BULLET_POOL_SIZE)
+
+    def pool_stats(self):
+        return {
+            "plastics": self.plastic_pool.stats(),
+            "turtle_bullets": self.turtle_bullet_pool.stats(),
+            "crab_bullets": self.crab_bullet_pool.stats(),
+        }
+
+    def start_wave(self):
+        """Resume stepping after the between-waves screen."""
+        self.wave_cleared = False
+
+    def resolve_bullet_hits(self, bullets, damage):
+        """Damage every plastic each bullet overlaps and return the coins earned."""
+        coins = 0
+        precise = self.mask_collisions
+        for bullet in bullets:
+            for plastic in self.plastic_hash.query(bullet.rect):
+                if bullet.rect.colliderect(plastic.rect) and (not precise or masks_overlap(bullet, plastic)):
+                    bullet.kill()
+                    if plastic.take_damage(damage):
+                        coins += 5 if isinstance(plastic, PlasticBoss) else 1
+        return coins
+
+    def spawn(self, dt):
+        """Spawn whatever the wave's schedule has due, and end the wave once it is cleared."""
+        budget, schedule = self.budget, self.schedule
+        budget.release(self.plastic_group)
+
+        # Under DEFER the wave's clock stops while the budget is full, so nothing scheduled is lost
+        if budget.policy == DEFER and not budget.has_room(self.plastic_group):
+            budget.stalled_ticks += 1
+        else:
+            schedule.wind(dt)
+
+        # Each due spawn asks the budget on its own, one it holds back stays queued with everything after it
+        wave = self.waves.wave(self.wave_number)
+        kind = schedule.due()
+        while kind is not None:
+            admitted = budget.admit_spawn(kind == BOSS, self.plastic_group)
+            if admitted is None:
+                break
+            schedule.pop()
+            self.total_plastic_spawned += 1
+            if admitted:  # Otherwise it merged into a live plastic
+                self._spawn_event(kind, wave)
+            kind = schedule.due()
+
+        # Wave completion check
+        if self.schedule.done and len(self.plastic_group) == 0 and not budget.waiting:
+            self.wave_number += 1
+            self.schedule = self.waves.wave(self.wave_number).compile()
+            self.wave_cleared = True
+
+    def _spawn_event(self, kind, wave):
+        """Spawn one scheduled event, the boss or a wave plastic."""
+        budget = self.budget
+        if kind == BOSS:
+            boss = PlasticBoss(self.crab, self.turtle, self.size, self.wave_number, self.plastic_group)
+            boss.configure(wave.boss_health, wave.boss_speed, wave.minion_interval)
+            boss.minion_factory = self.plastic_pool.acquire
+            boss.budget = budget
+            self.plastic_group.add(boss)
+        else:
+            plastic = self.plastic_pool.acquire(self.crab, self.turtle, self.size, self.wave_number)
+            plastic.speed *= wave.speed_multiplier
+            self.plastic_group.add(plastic)
+            budget.track(plastic)
+
+    def step(self, dt, inputs):
+        """Advance the game by one fixed sim step of dt seconds."""
+        timer = self.timer
+        self.ticks += 1
+        snapshot(self.moving_groups)
+
+        if inputs.shoot_at is not None:
+            self.turtle.shoot(self.turtle_bullets, inputs.shoot_at)
+            inputs.shoot_at = None
+        if inputs.crab_shoot:
+            self.crab.shoot(self.crab_bullets)
+            inputs.crab_shoot = False
+        timer.lap("input")
+
+        self.spawn(dt)
+        timer.lap("spawn")
+
+        self.turtle.update(dt)
+        timer.lap("update.turtle")
+        self.crab.update(inputs.keys, dt)
+        timer.lap("update.crab")
+        self.turtle_bullets.update(dt)
+        timer.lap("update.turtle_bullets")
+        self.crab_bullets.update(dt)
+        timer.lap("update.crab_bullets")
+        if self.flow is not None:
+            self.flow.update(self.players)
+        timer.lap("update.flow")
+        self.plastic_group.update(dt, self.flow)
+        timer.lap("update.plastics")
+        self.crosshair_group.update(dt, inputs.mouse_pos)
+        timer.lap("update.crosshair")
+
+        self.plastic_hash.rebuild(self.plastic_group)
+        timer.lap("collision.hash")
+        self.coin_count += self.resolve_bullet_hits(self.turtle_bullets, 100)
+        self.coin_count += self.resolve_bullet_hits(self.crab_bullets, 50)
+        timer.lap("collision.bullets")
+
+        self.crab.check_bullet_collision(self.plastic_hash, self.mask_collisions)
+        self.turtle.check_bullet_collision(self.plastic_hash, self.mask_collisions)
+        timer.lap("collision.players")
@@ -0,0 +1,86 @@
+"""Runs the game without a window, for load tests and balance checks.
+
+Run from the repository root so asset paths resolve:
+
+    python src/headless.py --wave 20 --ticks 20000 --god
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import time
+import pygame
+from engine.World import World, Inputs, PLASTIC_BUDGET, BUDGET_POLICY
+from engine.Budget import EntityBudget, POLICIES
+from engine.Rng import reseed
+
+def autopilot(world, inputs):
+    """Aim the crosshair at the nearest plastic and keep both players firing."""
+    target = None
+    best = None
+    for plastic in world.plastic_group:
+        distance = world.turtle.pos.distance_squared_to(plastic.pos)
+        if best is None or distance < best:
+            best, target = distance, plastic
+    if target is not None:
+        inputs.mouse_pos = target.rect.center
+        inputs.shoot_at = target.rect.center
+    inputs.crab_shoot = True
+
+def run(wave=1, ticks=10000, hz=60, god=False, seed=None, cap=PLASTIC_BUDGET, policy=BUDGET_POLICY):
+    """Step a fresh world for a number of ticks and return a summary dict."""
+    seed = reseed(seed)
+    world = World(budget=EntityBudget(cap, policy))
+    world.reset(wave)
+    world.prewarm_pools()
+    inputs = Inputs()
+    dt = 1 / hz
+    peak_plastics = 0
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        autopilot(world, inputs)
+        world.step(dt, inputs)
+        peak_plastics = max(peak_plastics, len(world.plastic_group))
+        if world.wave_cleared:
+            world.prewarm_pools()
+            world.start_wave()
+        if god:
+            world.turtle.health = world.crab.health = 3
+        elif world.game_over:
+            break
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seed": seed,
+        "ticks": world.ticks,
+        "sim_seconds": world.ticks * dt,
+        "wall_seconds": elapsed,
+        "ticks_per_second": world.ticks / elapsed if elapsed else 0,
+        "start_wave": wave,
+        "end_wave": world.wave_number,
+        "coins": world.coin_count,
+        "peak_plastics": peak_plastics,
+        "game_over": world.game_over,
+        "pools": world.pool_stats(),
+        "budget": world.budget.stats(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--wave", type=int, default=1, help="wave to start at")
+    parser.add_argument("--ticks", type=int, default=10000, help="sim steps to run")
+    parser.add_argument("--hz", type=int, default=60, help="sim steps per second")
+    parser.add_argument("--god", action="store_true", help="players never die")
+    parser.add_argument("--seed", type=int, help="seed for all gameplay randomness (random by default)")
+    parser.add_argument("--cap", type=int, default=PLASTIC_BUDGET, help="most plastics alive at once")
+    parser.add_argument("--policy", choices=POLICIES, default=BUDGET_POLICY, help="what boss minions do at the cap")
+    args = parser.parse_args()
+
+    pygame.init()
+    for key, value in run(args.wave, args.ticks, args.hz, args.god, args.seed, args.cap, args.policy).items():
+        print(f"{key}: {value}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -1,83 +1,155 @@
+import time
+STARTED = time.perf_counter()  # Startup timings count from here
+
 import pygame
 import random
 import asyncio
-from sprites.Turtle import Turtle
-from sprites.Crab import Crab
-from sprites.Plastic import Plastic
-from sprites.CrossHair import Crosshair
+import argparse
+from functools import partial
 from sprites.Shop import Shop
-from sprites.Plastic import PlasticBoss
-
-# Initialize Pygame
+from engine.AssetCache import assets, PRELOAD, BACKGROUND, ROTATED
+from engine.RotationCache import rotations
+from engine.EffectCache import effects
+from engine.Masks import masks
+from engine.Fonts import fonts, text_cache
+from engine.TextLayout import paragraphs
+from engine.Hud import Hud
+from engine.DirtyRects import DirtyRectRenderer
+from engine.FixedTimestep import FixedTimestep, interpolate
+from engine.World import World, Inputs, MASK_COLLISIONS
+from engine.Profiler import ProfilerOverlay
+from engine.Quality import QualityGovernor
+from engine.Rng import reseed
+from engine.Recorder import InputRecorder
+from engine.RenderQueue import RenderQueue, queue_world, HUD, CROSSHAIR
+from engine.Idle import IdleScreen
+from engine.Startup import StartupTimer, Loader, draw_loading_screen
+
+# Command line options, unknown ones are left alone for the web runtime
+parser = argparse.ArgumentParser(description="Save the ocean from plastic.")
+parser.add_argument("--seed", type=int, help="seed for all gameplay randomness (random by default)")
+parser.add_argument("--record", metavar="PATH", help="record every sim step's input to PATH, replay it with replay.py")
+parser.add_argument("--timing", action="store_true", help="print how long startup took, step by step")
+parser.add_argument("--stats", action="store_true", help="print asset cache, rotation cache and pool stats on exit")
+args, _ = parser.parse_known_args()
+startup = StartupTimer(STARTED)
+log = print if args.timing or args.stats else None  # Gameplay notices, only when asked for
+assets.log = log
+startup.step("imports")
+
+# Only the window is made up front, everything else loads behind the loading screen
 pygame.init()
 screen = pygame.display.set_mode((800, 600))
 clock = pygame.time.Clock()
+startup.step("window")
 
 # Game States
+LOADING = "loading"
 START_SCREEN = "start"
 PLAYING = "playing"
 GAME_OVER = "game_over"
 SHOP_SCREEN = "shop"
-
-# Boss wave configuration - CHANGE THIS TO ADJUST BOSS WAVE FREQUENCY
-BOSS_WAVE_INTERVAL = 3  # Boss appears every 3 waves (change to 5 if you want)
-
-game_state = START_SCREEN  # Start at the menu
-
-# Create Sprites
-crosshair = Crosshair()
-
-# Create Players
-turtle = Turtle(crosshair)
-crab = Crab()
-
-# Initialize Shop
-shop_font = pygame.font.Font(None, 30)
-shop = Shop(
-    screen,
-    shop_font,
-    turtle,
-    crab,
-    pygame.Rect(
-        screen.get_width() // 2 - 300,  # Center horizontally
-        screen.get_height(),            # Start off-screen (will be animated in)
-        600,                           # Width
-        400                            # Height
+IDLE_STATES = (START_SCREEN, SHOP_SCREEN, GAME_OVER)  # Only change on input, see engine/Idle.py
+
+# Simulation runs at a fixed rate, rendering is capped separately and interpolates
+SIM_HZ = 60  # Physics steps per second (60 or 120)
+MAX_FPS = 120  # Render cap, 0 for uncapped
+
+# Only redraw and push the regions that changed while PLAYING (set False for full flips)
+DIRTY_RECT_RENDERING = True
+
+game_state = LOADING  # Loading screen first, then the menu
+
+inputs = Inputs()
+timestep = FixedTimestep(SIM_HZ)
+
+# Same seed and same recorded input give the same game
+seed = reseed(args.seed)
+recorder = InputRecorder(args.record, seed, SIM_HZ) if args.record else None
+
+idle = IdleScreen()  # Throttles the menus
+render_queue = RenderQueue()  # Collects a frame's blits, see engine/RenderQueue.py
+profiler = ProfilerOverlay()  # F3 while playing
+governor = QualityGovernor(log=log)  # Trades effects and render rate for frame time while playing
+
+# Built by the loading steps below
+world = None
+shop = None
+hud = None
+renderer = None
+background_image = None
+
+def warm_caches():
+    """Rotations, masks and hit flashes, so spawning and firing never build a surface."""
+    # Bullets spawn at arbitrary angles, so fill their rotations (baked if there is a sheet) up front
+    for path, size in ROTATED:
+        bullet = assets.get(path, size)
+        rotations.warm(bullet, assets.baked_rotations(path, size))
+        if MASK_COLLISIONS:
+            masks.warm(bullet)
+    # Hit flashes for every kind of plastic
+    for path, size in (("assets/images/plastic.png", (40, 40)), ("assets/images/Monster.png", (100, 100))):
+        plastic = assets.get(path, size)
+        effects.flash(plastic)
+        if MASK_COLLISIONS:
+            masks.get(plastic)
+    if MASK_COLLISIONS:
+        # Every angle the players can turn to, so no mask is built mid-game
+        for path, size in (("assets/images/turtle.png", (100, 100)), ("assets/images/crab.png", (100, 80))):
+            masks.warm(assets.get(path, size))
+
+def load_background():
+    global background_image
+    try:
+        background_image = assets.get(*BACKGROUND, alpha=False)
+    except:
+        background_image = None
+        print("Could not load ocean.jpg - falling back to solid color background")
+
+def build_world():
+    # All game state lives in the world, this file only draws it and feeds it input
+    global world
+    world = World(screen.get_size())
+
+def build_shop():
+    global shop
+    shop_font = fonts.get(30)
+    shop = Shop(
+        screen,
+        shop_font,
+        world.turtle,
+        world.crab,
+        pygame.Rect(
+            screen.get_width() // 2 - 300,  # Center horizontally
+            screen.get_height(),            # Start off-screen (will be animated in)
+            600,                           # Width
+            400                            # Height
+        )
     )
-)
 
-# Create sprite groups
-player_sprites = pygame.sprite.Group(turtle, crab)
-turtle_bullets = pygame.sprite.Group()
-crab_bullets = pygame.sprite.Group()
-crosshair_group = pygame.sprite.Group(crosshair)
-plastic_group = pygame.sprite.Group()
-
-# Game variables
-last_plastic_spawn = pygame.time.get_ticks()
-PLASTIC_SPAWN_TIME = 1000
-coin_count = 0  # Starting coins
-wave_number = 1
-plastics_to_spawn = 4
-plastics_spawned = 0
-total_plastic_spawned = 0
-
-# Load images
-try:
-    coin_image = pygame.image.load("assets/images/coin.png").convert_alpha()
-    coin_image = pygame.transform.scale(coin_image, (30, 30))
-except:
-    # Fallback if coin image is missing
-    coin_image = pygame.Surface((30, 30), pygame.SRCALPHA)
-    pygame.draw.circle(coin_image, (255, 215, 0), (15, 15), 15)
-
-# Load background image
-try:
-    background_image = pygame.image.load("assets/images/ocean.jpg").convert()
-    background_image = pygame.transform.scale(background_image, (800, 600))
-except:
-    background_image = None
-    print("Could not load ocean.jpg - falling back to solid color background")
+def build_hud():
+    global hud, renderer
+    try:
+        coin_image = assets.get("assets/images/coin.png", (30, 30))
+    except:
+        # Fallback if coin image is missing
+        coin_image = pygame.Surface((30, 30), pygame.SRCALPHA)
+        pygame.draw.circle(coin_image, (255, 215, 0), (15, 15), 15)
+    hud = Hud(coin_image)
+    renderer = DirtyRectRenderer(screen, background_image, enabled=DIRTY_RECT_RENDERING)
+
+# One step per frame while the loading screen is up. Load, convert and scale
+# every sprite image before anything spawns.
+loader = Loader(
+    [(f"Loading {path.rsplit('/', 1)[-1]}", partial(assets.get, path, size)) for path, size in PRELOAD]
+    + [("Packing the atlas", assets.pack_atlas),
+       ("Loading ocean.jpg", load_background),
+       ("Warming caches", warm_caches),
+       ("Building the world", build_world),
+       ("Opening the shop", build_shop),
+       ("Drawing the HUD", build_hud)],
+    startup,
+)
 
 # Game information
 info = [
@@ -94,69 +166,36 @@ info = [
 ]
 
 
-def is_boss_wave(wave_number):
-    return wave_number % BOSS_WAVE_INTERVAL == 0
-
-def draw_text_wrapped(text, font, color, surface, x, y, max_width, line_gap):
-    """Renders the text with word wrapping within a maximum width, centers each line, and adds space between lines."""
-    words = text.split(' ')
-    lines = []
-    current_line = ""
-
-    for word in words:
-        test_line = current_line + word + " "
-        test_surface = font.render(test_line, True, color)
-        if test_surface.get_width() > max_width:
-            if current_line:
-                lines.append(current_line)
-            current_line = word + " "
-        else:
-            current_line = test_line
-
-    if current_line:
-        lines.append(current_line)
-
-    y_offset = y
-    for line in lines:
-        line_surface = font.render(line, True, color)
-        line_x = x - line_surface.get_width() // 2
-        surface.blit(line_surface, (line_x, y_offset))
-        y_offset += line_surface.get_height() + line_gap
-
 def draw_start_screen():
     """Draws the start screen with centered instructions."""
+    wave_number = world.wave_number
     if background_image:
         screen.blit(background_image, (0, 0))
     else:
         screen.fill((0, 0, 50))  # Fallback color
 
-    font = pygame.font.Font(None, 45)
-    
     if wave_number == 1:
-        text = font.render("Press any key to start!", True, (255, 255, 255))
+        text = text_cache.render("Press any key to start!", 45, (255, 255, 255))
         text_rect = text.get_rect(center=(screen.get_width() // 2, (screen.get_height() // 2)))
     else:
-        if is_boss_wave(wave_number):
-            boss_text = font.render("BOSS WAVE!", True, (255, 0, 0))
+        if world.waves.is_boss_wave(wave_number):
+            boss_text = text_cache.render("BOSS WAVE!", 45, (255, 0, 0))
             boss_rect = boss_text.get_rect(center=(screen.get_width() // 2, (screen.get_height() // 2) - 160))
             screen.blit(boss_text, boss_rect)
-            text = font.render("Press any key to continue!", True, (255, 255, 255))
+            text = text_cache.render("Press any key to continue!", 45, (255, 255, 255))
             text_rect = text.get_rect(center=(screen.get_width() // 2, (screen.get_height() // 2) - 120))
         else:
-            text = font.render("Press any key to continue!", True, (255, 255, 255))
+            text = text_cache.render("Press any key to continue!", 45, (255, 255, 255))
             text_rect = text.get_rect(center=(screen.get_width() // 2, (screen.get_height() // 2) - 120))
 
-    font = pygame.font.Font(None, 30)
     if wave_number > 1:
         message = info[wave_number - 2]
-        draw_text_wrapped(message, font, (255, 255, 255), screen, screen.get_width() // 2, screen.get_height() // 2 + 50, 400, 10)
+        paragraph = paragraphs.render(message, 30, (255, 255, 255), 400, 10)
+        screen.blit(paragraph, paragraph.get_rect(midtop=(screen.get_width() // 2, screen.get_height() // 2 + 50)))
         
-        draw_health(screen, turtle, crab)
-        draw_coins(screen)
-        draw_wave(screen)
+        hud.draw(screen, world.turtle, world.crab, world.coin_count, wave_number)
 
     screen.blit(text, text_rect)
-    pygame.display.flip()
 
 def draw_game_over():
     """Draws the game over screen with centered text."""
@@ -165,91 +204,35 @@ def draw_game_over():
     else:
         screen.fill((50, 0, 0))  # Fallback color
 
-    font = pygame.font.Font(None, 50)
-
-    game_over_text = font.render("Game Over!", True, (255, 255, 255))
-    restart_text = font.render("Press R to Restart", True, (255, 255, 255))
+    game_over_text = text_cache.render("Game Over!", 50, (255, 255, 255))
+    restart_text = text_cache.render("Press R to Restart", 50, (255, 255, 255))
 
     game_over_rect = game_over_text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2 - 25))
     restart_rect = restart_text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2 + 25))
 
     screen.blit(game_over_text, game_over_rect)
     screen.blit(restart_text, restart_rect)
-    
-    pygame.display.flip()
-
-def draw_health(screen, turtle, crab):
-    font = pygame.font.Font(None, 30)
-
-    def draw_character_health(character, x, y):
-        image = pygame.transform.scale(character.original_image, (30, 30))
-        screen.blit(image, (x, y))
-        health_text = font.render(f"{character.health}", True, (255, 255, 255))
-        text_x = x + image.get_width() + 10
-        text_y = y + (image.get_height() - health_text.get_height()) // 2
-        screen.blit(health_text, (text_x, text_y))
-
-    draw_character_health(turtle, 10, 10)
-    draw_character_health(crab, 10, 50)
-
-def draw_coins(screen):
-    coin_x, coin_y = 700, 10
-    screen.blit(coin_image, (coin_x, coin_y))
-    font = pygame.font.Font(None, 30)
-    coin_text = font.render(f"{coin_count:04d}", True, (255, 255, 255))
-    text_x = coin_x + coin_image.get_width() + 5
-    text_y = coin_y + (coin_image.get_height() - coin_text.get_height()) // 2
-    screen.blit(coin_text, (text_x, text_y))
-
-def draw_wave(screen):
-    font = pygame.font.Font(None, 30)
-    wave_text = font.render(f"Wave: {wave_number:02d}", True, (255, 255, 255))
-    screen.blit(wave_text, (700, 50))
-
-def reset_game():
-    global game_state, coin_count, wave_number, plastics_spawned, plastics_to_spawn, total_plastic_spawned, last_plastic_spawn
-    
-    game_state = PLAYING
-    coin_count = 100  # Reset to starting coins
-    wave_number = 1
-    plastics_spawned = 0
-    plastics_to_spawn = 4
-    total_plastic_spawned = 0
-    last_plastic_spawn = pygame.time.get_ticks()
-    
-    turtle_bullets.empty()
-    crab_bullets.empty()
-    plastic_group.empty()
-    
-    turtle.health = 3
-    crab.health = 3
-    
-    turtle.pos = pygame.Vector2(400, 300)
-    crab.pos = pygame.Vector2(200, 200)
-    turtle.rect.center = turtle.pos
-    crab.rect.center = crab.pos
-    turtle.update_hitbox()
-    crab.update_hitbox()
-    
-    crosshair.pos = pygame.Vector2(screen.get_width() // 2, screen.get_height() // 2)
-    crosshair.rect.center = crosshair.pos
-
-def calc_plastic_total_spawned(wave_number):
-    sum = 0
-    for i in range(wave_number):
-        sum += i
-    sum *= 3
-    sum += wave_number * 4
-    return sum
-
-def run_level():
-    global game_state, last_plastic_spawn, coin_count, wave_number, plastics_spawned, plastics_to_spawn, total_plastic_spawned
-    
+
+def draw_world():
+    """Draws the world as it is, used behind the shop."""
     if background_image:
         screen.blit(background_image, (0, 0))
     else:
         screen.fill((0, 0, 50))  # Fallback color
     
+    queue_world(render_queue, world)
+    hud.draw(render_queue.on(HUD), world.turtle, world.crab, world.coin_count, world.wave_number)
+    render_queue.flush(screen)
+
+def run_level(frame_time):
+    """Handle input, run the sim steps that fit in frame_time seconds, then draw one frame."""
+    global game_state
+    timer = profiler.timer
+    timer.begin_frame()
+    
+    # Restores the background (only under last frame's sprites in dirty-rect mode)
+    renderer.begin_frame()
+    
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             return False
@@ -259,131 +242,183 @@ def run_level():
             elif event.key == pygame.K_p:  # Open shop with P key
                 game_state = SHOP_SCREEN
                 shop.toggle()
+            elif event.key == pygame.K_F3:
+                world.timer = profiler.toggle()
+                renderer.invalidate()  # Clears the overlay when it is hidden
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            turtle.shoot(turtle_bullets, pygame.mouse.get_pos())
+            inputs.shoot_at = pygame.mouse.get_pos()
 
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            crab.shoot(crab_bullets)
-
-    keys = pygame.key.get_pressed()
-    
-    current_time = pygame.time.get_ticks()
-    number_of_plastics_that_should_have_been_spawned = calc_plastic_total_spawned(wave_number)
-    
-    # Spawn boss on boss waves instead of regular plastics
-    if is_boss_wave(wave_number) and plastics_spawned == 0 and total_plastic_spawned < number_of_plastics_that_should_have_been_spawned:
-        plastic_group.add(PlasticBoss(crab, turtle, screen, wave_number, plastic_group))
-        total_plastic_spawned += 1
-        plastics_spawned += 1
-        last_plastic_spawn = current_time
-    # Regular plastic spawning
-    elif plastics_spawned < plastics_to_spawn and current_time - last_plastic_spawn >= PLASTIC_SPAWN_TIME:
-        plastic_group.add(Plastic(crab, turtle, screen, wave_number))  
-        total_plastic_spawned += 1
-        plastics_spawned += 1
-        last_plastic_spawn = current_time
-
-    # Wave completion check
-    if len(plastic_group) == 0 and total_plastic_spawned == number_of_plastics_that_should_have_been_spawned:
-        wave_number += 1
-        plastics_spawned = 0
-        plastics_to_spawn = 4 + (wave_number - 1) * 3
-        game_state = START_SCREEN
-
-    turtle.update(screen)
-    crab.update(keys, screen)
-    turtle_bullets.update(screen)
-    crab_bullets.update(screen)
-    plastic_group.update(screen)
-    crosshair_group.update()
-    
-    for bullet in turtle_bullets:
-        for plastic in plastic_group:
-            if bullet.rect.colliderect(plastic.rect):
-                bullet.kill()
-                if plastic.take_damage(100):
-                    coin_count += 5 if isinstance(plastic, PlasticBoss) else 1
-
-    for bullet in crab_bullets:
-        for plastic in plastic_group:
-            if bullet.rect.colliderect(plastic.rect):
-                bullet.kill()
-                if plastic.take_damage(50):
-                    coin_count += 5 if isinstance(plastic, PlasticBoss) else 1
-
-    crab.check_bullet_collision(plastic_group)
-    turtle.check_bullet_collision(plastic_group)
-
-    if turtle.health <= 0 or crab.health <= 0:
-        game_state = GAME_OVER
+            inputs.crab_shoot = True
+
+    inputs.mouse_pos = pygame.mouse.get_pos()
+    inputs.keys = pygame.key.get_pressed()
+    quality = governor.settings
+    if world.crosshair.smoothing != quality["crosshair_smoothing"]:
+        # Changes where the turtle heads, so replays need to know
+        world.crosshair.smoothing = quality["crosshair_smoothing"]
+        if recorder is not None:
+            recorder.smoothing(world.crosshair.smoothing)
+    timer.lap("events")
+
+    for _ in range(timestep.advance(frame_time)):
+        if game_state != PLAYING:
+            break
+        if recorder is not None:
+            recorder.tick(inputs)
+        world.step(timestep.dt, inputs)
+        if world.wave_cleared:
+            game_state = START_SCREEN
+        if world.game_over:
+            game_state = GAME_OVER
+
+    if game_state == GAME_OVER:
+        renderer.present()
         return True
 
-    turtle_bullets.draw(screen) 
-    crab_bullets.draw(screen) 
-    player_sprites.draw(screen)
-    plastic_group.draw(screen)
-    draw_health(screen, turtle, crab)
-    draw_coins(screen)
-    draw_wave(screen)
-    crosshair_group.draw(screen)
-
+    # Draw everything part way between the last two sim states
+    interpolate(world.moving_groups, timestep.alpha)
+    timer.lap("draw.interpolate")
+
+    # Every sprite and the HUD go out in one blits() call, bullets at the bottom, the crosshair on top
+    queue_world(render_queue, world, quality["blink_flash"])
+    hud.draw(render_queue.on(HUD), world.turtle, world.crab, world.coin_count, world.wave_number)
+    render_queue.add_sprites(world.crosshair_group, CROSSHAIR)
+    timer.lap("draw.queue")
+    renderer.add_rects(render_queue.flush(screen))
+    timer.lap("draw.blits")
+
+    if quality["debug_hitbox"]:
+        renderer.add_rects([plastic.draw_hitbox(screen) for plastic in world.plastic_group])
+        timer.lap("draw.hitboxes")
+
+    if profiler.enabled:
+        renderer.add_rect(profiler.draw(screen, world, frame_time))
+        timer.lap("profiler")
+
+    renderer.present()
+    timer.lap("flip")
+    timer.end_frame()
     return True
 
 # Main Game Loop
 async def main():
+    global game_state
     running = True
+    previous_state = None
+    frame_time = 0  # Real seconds the last frame took
     while running:
-        if game_state == START_SCREEN:       
-            draw_start_screen()
+        # Other screens draw over the whole window, so repaint everything when play resumes
+        if game_state == PLAYING and previous_state != PLAYING:
+            renderer.invalidate()
+            timestep.reset()
+        # Allocate the coming wave's bullets and plastics while nothing is moving
+        if game_state == START_SCREEN and previous_state != START_SCREEN:
+            world.prewarm_pools()
+        # Menus draw once when shown and then wait for input
+        if game_state != previous_state:
+            idle.invalidate()
+        previous_state = game_state
+
+        if game_state == LOADING:
+            draw_loading_screen(screen, loader)
+            pygame.display.flip()
+            startup.mark_first_frame()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+            if loader.done:
+                # Everything is loaded by now, any further image load is a frame spike
+                assets.mark_running()
+                game_state = START_SCREEN
+            else:
+                loader.run_next()
+
+        elif game_state == START_SCREEN:
+            # Nothing moves until a key is pressed, so the screen is composed once
+            if idle.dirty:
+                draw_start_screen()
+                pygame.display.flip()
+                idle.drawn()
+            startup.mark_interactive()
             for event in pygame.event.get():
+                idle.watch(event)
                 if event.type == pygame.QUIT:
                     running = False
                 if event.type == pygame.KEYDOWN:
+                    world.start_wave()
+                    if recorder is not None:
+                        recorder.start_wave()
                     game_state = PLAYING
     
         elif game_state == SHOP_SCREEN:
-            if background_image:
-                screen.blit(background_image, (0, 0))
-            else:
-                screen.fill((0, 0, 50))  # Fallback color
-            
-            turtle_bullets.draw(screen)
-            crab_bullets.draw(screen)
-            player_sprites.draw(screen)
-            plastic_group.draw(screen)
-            draw_health(screen, turtle, crab)
-            draw_coins(screen)
-            draw_wave(screen)
-        
-            shop.update(coin_count)
-            screen.blit(shop.image, shop.rect.topleft)
-        
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            for event in events:
+                idle.watch(event)
                 if event.type == pygame.QUIT:
                     running = False
-                coins_spent = shop.handle_input(event, coin_count)
-                coin_count -= coins_spent
+                coins_spent = shop.handle_input(event, world.coin_count)
+                world.coin_count -= coins_spent
+                if coins_spent and recorder is not None:
+                    recorder.buy(shop.hovered_item)
+
+            # Recomposed only while it slides or when input (hover, clicks) may have changed it
+            if idle.dirty or events or shop.is_animating:
+                draw_world()
+                shop.update(world.coin_count, frame_time)
+                screen.blit(shop.image, shop.rect.topleft)
+                pygame.display.flip()
+                idle.drawn()
         
             if not shop.is_open and not shop.is_animating:
                 game_state = PLAYING
 
         elif game_state == PLAYING:
-            running = run_level()
+            # run_level presents its own frame through the renderer
+            running = run_level(frame_time)
 
         elif game_state == GAME_OVER:
-            draw_game_over()
+            if idle.dirty:
+                draw_game_over()
+                pygame.display.flip()
+                idle.drawn()
             for event in pygame.event.get():
+                idle.watch(event)
                 if event.type == pygame.QUIT:
                     running = False
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-                    reset_game()
+                    world.reset()
+                    if recorder is not None:
+                        recorder.reset()
                     game_state = PLAYING
         
         await asyncio.sleep(0)
-        pygame.display.flip()
-        clock.tick(60)
-
-pygame.quit()
+        divisor = governor.settings["render_divisor"]
+        if game_state == previous_state and game_state in IDLE_STATES and not (shop.is_animating or idle.dirty):
+            # Sleep until input instead of redrawing a screen that can't change
+            await idle.wait()
+            frame_time = clock.tick() / 1000
+        elif game_state == LOADING:
+            frame_time = clock.tick() / 1000  # No cap, get to the menu as soon as possible
+        else:
+            frame_time = clock.tick(MAX_FPS if divisor == 1 else SIM_HZ // divisor) / 1000
+        if game_state == PLAYING and previous_state == PLAYING:
+            governor.observe(clock.get_rawtime())
+        else:
+            governor.reset()
+
+    if args.timing:
+        print("Startup:")
+        print(startup.report())
+    if args.stats:
+        print(f"Asset cache: {assets.stats()}")
+        print(f"Rotation cache: {rotations.stats()}")
+        if world is not None:
+            print(f"Pools: {world.pool_stats()}")
+    if recorder is not None and world is not None:
+        recorder.close(world)
+        print(f"Recorded {world.ticks} ticks with seed {seed} to {recorder.path}")
+    pygame.quit()
 
 asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""Replays a session recorded with `python src/main.py --record FILE`, as fast as it will go.
+
+Run from the repository root so asset paths resolve:
+
+    python src/replay.py session.rec
+    python src/replay.py session.rec --draw
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import time
+import pygame
+from engine.World import World, Inputs
+from engine.Rng import reseed
+from engine.PhaseTimer import PhaseTimer
+from engine.Fonts import fonts
+from engine.Recorder import InputLog, TICK, START_WAVE, RESET, BUY, SMOOTHING, outcome
+from sprites.Shop import Shop
+
+def replay(log, draw=False):
+    """Feed a recording to a fresh World and return a summary dict with per-phase timings."""
+    reseed(log.seed)
+    world = World()
+    world.prewarm_pools()
+    timer = PhaseTimer()
+    world.timer = timer
+    inputs = Inputs()
+    dt = 1 / log.hz
+    shop = None
+
+    if draw:
+        from bench import open_display, draw_frame
+        screen, hud, background = open_display()
+
+    start = time.perf_counter()
+    for record in log.records:
+        kind = record[0]
+        if kind == TICK:
+            timer.begin_frame()
+            _, inputs.mouse_pos, inputs.keys, inputs.shoot_at, inputs.crab_shoot = record
+            world.step(dt, inputs)
+            if draw:
+                draw_frame(screen, world, hud, background)
+                timer.lap("draw")
+                pygame.display.flip()
+                timer.lap("flip")
+            timer.end_frame()
+        elif kind == START_WAVE:
+            world.prewarm_pools()
+            world.start_wave()
+        elif kind == RESET:
+            world.reset(record[1])
+        elif kind == BUY:
+            if shop is None:
+                shop = Shop(pygame.Surface(world.size), fonts.get(30), world.turtle, world.crab,
+                            pygame.Rect(world.size[0] // 2 - 300, world.size[1], 600, 400))
+            world.coin_count -= shop.items[record[1]]["action"](world.coin_count)
+        elif kind == SMOOTHING:
+            world.crosshair.smoothing = bool(record[1])
+    elapsed = time.perf_counter() - start
+
+    result = outcome(world)
+    return {
+        "seed": log.seed,
+        "ticks": world.ticks,
+        "sim_seconds": world.ticks * dt,
+        "wall_seconds": elapsed,
+        "speedup": world.ticks * dt / elapsed if elapsed else 0,
+        "outcome": result,
+        "recorded_outcome": log.outcome,
+        "identical": log.outcome is not None and tuple(log.outcome) == result,
+        "phases": timer.summary(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", help="file written by main.py --record")
+    parser.add_argument("--draw", action="store_true", help="also draw every tick, to time rendering")
+    args = parser.parse_args()
+
+    pygame.init()
+    summary = replay(InputLog.load(args.recording), args.draw)
+    phases = summary.pop("phases")
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+    for phase, stats in phases.items():
+        print(f"{phase}: " + "  ".join(f"{stat}={value:.3f}" for stat, value in stats.items()))
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
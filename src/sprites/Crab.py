@@ -1,12 +1,14 @@
 import pygame
 import math
 from sprites.Bullet import CrabBullet
+from engine.AssetCache import assets
+from engine.RotationCache import rotations
+from engine.Masks import masks_overlap
 
 class Crab(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
-        original_image = pygame.image.load("assets/images/crab.png").convert_alpha()
-        self.original_image = pygame.transform.scale(original_image, (100, 80))
+        self.original_image = assets.get("assets/images/crab.png", (100, 80))
         self.image = self.original_image
         self.rect = self.image.get_rect(center=(200, 200))
 
@@ -17,19 +19,23 @@ class Crab(pygame.sprite.Sprite):
         self.update_hitbox()  # Align hitbox with the crab's rect
 
         self.pos = pygame.Vector2(self.rect.center)
-        self.speed = 3
+        self.prev_pos = self.pos.copy()  # Position at the previous sim step, for interpolation
+        self.speed = 180  # Pixels per second
         self.angle = 0  # Store the current rotation angle
 
         self.health = 3
 
-        self.shoot_cooldown = 300  
-        self.last_shot_time = 0  
+        self.shoot_cooldown = 0.3  # Seconds between shots
+        self.shoot_timer = 0  # Sim time left until the crab can shoot again
+        self.bullet_factory = CrabBullet  # World swaps in its bullet pool
 
     def update_hitbox(self):
         """Keep the hitbox centered within the crab's rect."""
         self.hitbox.center = self.rect.center
 
-    def update(self, keys, screen):
+    def update(self, keys, dt):
+        """Advance the crab by one sim step of dt seconds."""
+        self.shoot_timer = max(0, self.shoot_timer - dt)
         movement_vector = pygame.Vector2(0, 0)
 
         if keys[pygame.K_w]:
@@ -46,7 +52,7 @@ class Crab(pygame.sprite.Sprite):
             movement_vector = movement_vector.normalize() * self.speed
 
         # Update position
-        self.pos += movement_vector
+        self.pos += movement_vector * dt
 
         # Get current image size
         image_width, image_height = self.image.get_size()
@@ -59,25 +65,22 @@ class Crab(pygame.sprite.Sprite):
         # Rotate crab based on movement
         if movement_vector.length() > 0:
             self.angle = math.degrees(math.atan2(-movement_vector.y, movement_vector.x))
-            self.image = pygame.transform.rotate(self.original_image, self.angle + 270)
+            self.image = rotations.get(self.original_image, self.angle + 270).image
 
         # Update rect
         self.update_hitbox()
         self.rect = self.image.get_rect(center=self.pos)
 
-        # pygame.draw.rect(screen, (255, 0, 0), self.hitbox, 2)  # Red border for hitbox
-
     def shoot(self, bullets_group):
         """Shoot a bullet in the direction the crab is facing."""
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_shot_time >= self.shoot_cooldown:
+        if self.shoot_timer <= 0:
             # Convert angle to radians for velocity calculation
             angle_rad = math.radians(self.angle)
             direction = pygame.Vector2(math.cos(angle_rad), -math.sin(angle_rad))  # Negative sin to match Pygame's coordinate system
 
-            bullet = CrabBullet(self.rect.center, direction)  
+            bullet = self.bullet_factory(self.pos, direction)  
             bullets_group.add(bullet)
-            self.last_shot_time = current_time
+            self.shoot_timer = self.shoot_cooldown
 
     def take_damage(self, amount=1):
         """Decreases the crab's health and checks for game over."""
@@ -85,9 +88,13 @@ class Crab(pygame.sprite.Sprite):
         if self.health <= 0:
             self.health = 0
 
-    def check_bullet_collision(self, bullets_group):
-        """Check if a bullet collides with the crab's hitbox."""
-        for bullet in bullets_group:
-            if self.hitbox.colliderect(bullet.hitbox):  # Check for collision with bullet's hitbox
+    def check_bullet_collision(self, spatial_hash, precise=False):
+        """Check if anything indexed in the spatial hash collides with the crab's hitbox.
+
+        precise also requires the two images' opaque pixels to overlap.
+        """
+        for bullet in spatial_hash.query(self.hitbox):
+            # Check for collision with bullet's hitbox
+            if self.hitbox.colliderect(bullet.hitbox) and (not precise or masks_overlap(self, bullet)):
                 self.take_damage()  # Decrease health if collision occurs
                 bullet.kill()  # Remove the bullet after collision
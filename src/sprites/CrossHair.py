@@ -1,16 +1,23 @@
 import pygame
+import math
+from engine.AssetCache import assets
 
 class Crosshair(pygame.sprite.Sprite):
-    def __init__(self, size=(40, 40), smoothness=0.1):
+    def __init__(self, pos=(400, 300), size=(40, 40), follow_rate=6.3):
         super().__init__()
-        self.original_image = pygame.image.load("assets/images/crosshair.png").convert_alpha()
-        self.image = pygame.transform.scale(self.original_image, size)
-        self.rect = self.image.get_rect()
-        self.pos = pygame.Vector2(pygame.mouse.get_pos())
-        self.smoothness = smoothness  # Lower = more lag (0.05-0.2 works well)
+        self.image = assets.get("assets/images/crosshair.png", size)
+        self.pos = pygame.Vector2(pos)
+        self.rect = self.image.get_rect(center=self.pos)
+        self.prev_pos = self.pos.copy()  # Position at the previous sim step, for interpolation
+        self.follow_rate = follow_rate  # Per second, lower = more lag (3-13 works well)
+        self.smoothing = True  # Off snaps straight to the mouse
         
-    def update(self):
-        target_pos = pygame.Vector2(pygame.mouse.get_pos())
-        # Smooth movement with linear interpolation
-        self.pos += (target_pos - self.pos) * self.smoothness
-        self.rect.center = self.pos
\ No newline at end of file
+    def update(self, dt, mouse_pos):
+        target_pos = pygame.Vector2(mouse_pos)
+        if not self.smoothing:
+            self.pos.update(target_pos)
+            self.rect.center = self.pos
+            return
+        # Exponential smoothing, the same lag at any sim rate
+        self.pos += (target_pos - self.pos) * (1 - math.exp(-self.follow_rate * dt))
+        self.rect.center = self.pos
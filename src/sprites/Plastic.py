@@ -1,44 +1,96 @@
 import pygame
-import random
-
-class Plastic(pygame.sprite.Sprite):
-    def __init__(self, crab, turtle, screen, wave_number):
+from engine.AssetCache import assets
+from engine.Pool import Pooled
+from engine.Rng import rng
+from engine.EffectCache import effects
+
+class Plastic(Pooled, pygame.sprite.Sprite):
+    # Set while the plastic lives in a PlasticStore, which then owns its
+    # speed, health and blink state (see the properties below)
+    store = None
+    slot = -1
+
+    def __init__(self, crab, turtle, screen_size, wave_number):
         super().__init__()
+        self.allocate()
+        self.reset(crab, turtle, screen_size, wave_number)
 
-        # Load the plastic image
-        self.image = pygame.image.load("assets/images/plastic.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (40, 40))  # Resize the image
+    def allocate(self):
+        """Create the objects reset() fills in, once per instance."""
+        # Shared plastic image, already scaled to 40x40
+        self.image = assets.get("assets/images/plastic.png", (40, 40))
 
         # Define the main rectangle (positioning and rendering)
         self.rect = self.image.get_rect()
-
-        # Spawn from the right side randomly along the Y-axis
-        screen_width = screen.get_width()
-        self.rect.x = screen_width - 100 # Right edge of the screen
-        self.rect.y = random.randint(50, 550)  # Random vertical position
+        self.pos = pygame.Vector2()  # Exact position, rect is rounded from it
+        self.prev_pos = pygame.Vector2()  # Position at the previous sim step, for interpolation
 
         # Create a smaller hitbox (shrink by 20%) and center it
         hitbox_width = int(self.rect.width * 0.5)
         hitbox_height = int(self.rect.height * 0.5)
         self.hitbox = pygame.Rect(0, 0, hitbox_width, hitbox_height)
+
+    def reset(self, crab, turtle, screen_size, wave_number):
+        """Spawn the plastic at the right edge of the screen with fresh stats."""
+        # Spawn from the right side randomly along the Y-axis
+        screen_width = screen_size[0]
+        self.rect.x = screen_width - 100 # Right edge of the screen
+        self.rect.y = rng.randint(50, 550)  # Random vertical position
+        self.pos.update(self.rect.center)
+        self.prev_pos.update(self.pos)
         self.update_hitbox()  # Ensure it starts centered
 
-        # Randomly choose between Crab or Turtle as the target
+        # Heads for the crab when updated without the World's flow field,
+        # which steers toward whichever player is nearest
         self.target = crab
 
-        self.speed = random.randint(1, 3) * (wave_number / 7)  # Different speeds for 
+        self.speed = rng.randint(1, 3) * (wave_number / 7)  # Different speeds for 
         if self.speed < 1: self.speed = 1
+        self.speed *= 60  # Pixels per second
         self.health = 100
         
         # Blinking effect variables
         self.blinking = False  # Whether the plastic is blinking
-        self.blink_time = 0  # Time when the blinking effect started
-        self.blink_duration = 500  # Duration of blinking effect in milliseconds
+        self.blink_elapsed = 0  # Seconds since the blinking effect started
+        self.blink_duration = 0.5  # Duration of blinking effect in seconds
+        self.blink_interval = 1 / 60  # Seconds between visibility toggles
         self.visible = True  # Whether the plastic is visible during blinking
 
+    def _stored(name):
+        """Property that reads and writes the store's array while attached, the sprite otherwise."""
+        private = "_" + name
+
+        def get(self):
+            if self.store is not None:
+                return getattr(self.store, name)[self.slot]
+            return getattr(self, private)
+
+        def set(self, value):
+            if self.store is not None:
+                getattr(self.store, name)[self.slot] = value
+            else:
+                setattr(self, private, value)
+
+        return property(get, set)
+
+    speed = _stored("speed")
+    health = _stored("health")
+    blinking = _stored("blinking")
+    blink_elapsed = _stored("blink_elapsed")
+    del _stored
+
     def update_hitbox(self):
         self.hitbox.center = self.rect.center
 
+    def move_to(self, center):
+        """Place the plastic at a position without interpolating from the old one."""
+        self.pos.update(center)
+        self.prev_pos.update(self.pos)
+        self.rect.center = self.pos
+        self.update_hitbox()
+        if self.store is not None:
+            self.store.pos[self.slot] = self.pos
+
     def take_damage(self, amount=10):
         self.health -= amount
         if self.health <= 0:
@@ -47,45 +99,44 @@ class Plastic(pygame.sprite.Sprite):
         
         # Start blinking effect when taking damage
         self.blinking = True
-        self.blink_time = pygame.time.get_ticks()  # Record the time the damage was taken
+        self.blink_elapsed = 0  # Restart the blink timer
         return False
 
-    def update(self, screen):
-        """Move the plastic towards the target and update hitbox."""
+    def update(self, dt, flow=None):
+        """Move the plastic by one sim step of dt seconds and update hitbox.
 
-        # Handle blinking effect (same as before)
+        With a FlowField the plastic follows it toward the nearest living
+        player, without one it heads for its own target. Plastics in a
+        PlasticStore are moved by PlasticStore.step() instead.
+        """
+
+        # Handle blinking effect, the plastic is stunned while it blinks
         if self.blinking:
-            elapsed_time = pygame.time.get_ticks() - self.blink_time
-            if elapsed_time > self.blink_duration:
+            self.blink_elapsed += dt
+            if self.blink_elapsed > self.blink_duration:
                 self.blinking = False
                 self.visible = True
             else:
-                self.visible = not self.visible
-                if self.visible:
-                    bright_surface = self.image.copy()
-                    bright_surface.fill((255, 255, 255, 60), special_flags=pygame.BLEND_ADD)
-                    screen.blit(bright_surface, self.rect)
-                    return
-                else:
-                    return
-
-        # Calculate direction to the target
-        target_pos = pygame.Vector2(self.target.rect.centerx, self.target.rect.centery)
-        current_pos = pygame.Vector2(self.rect.centerx, self.rect.centery)
-        direction = target_pos - current_pos
-
-        # Ensure direction is valid and normalized
-        if direction.length() > 1:
-            direction = direction.normalize()
+                # Toggle visibility every blink_interval, starting hidden
+                self.visible = int(self.blink_elapsed / self.blink_interval + 1e-6) % 2 == 0
+                return
+
+        if flow is not None:
+            direction = flow.steer(self.rect, self.pos)
         else:
+            # Calculate direction to the target
+            target_pos = pygame.Vector2(self.target.rect.center)
+            direction = target_pos - self.pos
+            # Ensure direction is valid and normalized
+            direction = direction.normalize() if direction.length() > 1 else None
+
+        if direction is None:
             # Apply a small nudge towards the target to prevent getting stuck
-            direction = pygame.Vector2(random.choice([-1, 1]), random.choice([-1, 1])).normalize()
+            direction = pygame.Vector2(rng.choice([-1, 1]), rng.choice([-1, 1])).normalize()
 
         # Move the plastic
-        self.rect.x += direction[0] * self.speed
-        self.rect.y += direction[1] * self.speed
-
-        pygame.draw.rect(screen, (255, 0, 0), self.hitbox, 2) 
+        self.pos += direction * self.speed * dt
+        self.rect.center = self.pos
 
         # Update hitbox
         self.update_hitbox()
@@ -94,54 +145,82 @@ class Plastic(pygame.sprite.Sprite):
         if self.rect.right < 0:  # Check if the plastic is off-screen
             self.kill()
 
-        # Draw the plastic
-        if self.visible:
-            screen.blit(self.image, self.rect)
+    def frame_image(self, flash=True):
+        """The surface to draw this frame: the hit flash while blinking, None while blinked out."""
+        if self.blinking:
+            if not self.visible:
+                return None
+            return effects.flash(self.image, 60) if flash else self.image
+        return self.image
+
+    def draw_hitbox(self, screen):
+        """Debug outline of the hitbox, at the sim position rather than the interpolated rect."""
+        return pygame.draw.rect(screen, (255, 0, 0), self.hitbox, 2)
 
 class PlasticBoss(Plastic):
-    def __init__(self, crab, turtle, screen, wave_number, plastic_group):
+    def __init__(self, crab, turtle, screen_size, wave_number, plastic_group):
         # Initialize the parent Plastic class with all required parameters
-        super().__init__(crab, turtle, screen, wave_number)
+        super().__init__(crab, turtle, screen_size, wave_number)
         
         # Store references to the players
         self.crab = crab
         self.turtle = turtle
         self.wave_number = wave_number
         self.plastic_group= plastic_group
+        self.screen_size = screen_size
+        self.minion_factory = Plastic  # World swaps in its plastic pool
+        self.budget = None  # EntityBudget limiting minions, set by the World
         
         # Boss-specific attributes
         self.health = 100 + (wave_number * 50)  # Boss has more health
         self.size = 100  # Bigger size for boss
-        self.spawn_timer = 0
-        self.spawn_interval = 5000  # Spawn minions every 3 seconds
+        self.spawn_interval = 5  # Spawn minions every 5 seconds
+        self.spawn_timer = self.spawn_interval  # Seconds since the last burst, first one is immediate
         
-        # Create boss image
-        self.image = pygame.image.load("assets/images/monster.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.size, self.size))
+        # Shared boss image
+        self.image = assets.get("assets/images/Monster.png", (self.size, self.size))
         self.rect = self.image.get_rect()
-        self.original_image = self.image.copy()
-        self.speed = 1  # Slower movement
+        self.original_image = self.image
+        
+        self.speed = 60  # Slower movement, pixels per second
         
         # Set initial position (you might want to customize this)
-        self.rect.centerx = random.randint(100, screen.get_width() - 100)
-        self.rect.centery = random.randint(100, screen.get_height() - 100)
+        self.move_to((rng.randint(100, screen_size[0] - 100),
+                      rng.randint(100, screen_size[1] - 100)))
+
+    def configure(self, health, speed, spawn_interval):
+        """Apply a wave definition's boss settings, before the boss joins its group."""
+        self.health = health
+        self.speed = speed
+        self.spawn_interval = spawn_interval
+        self.spawn_timer = spawn_interval  # First burst is still immediate
         
-    def update(self, screen):
-        super().update(screen)
-        current_time = pygame.time.get_ticks()
+    def update(self, dt, flow=None):
+        super().update(dt, flow)
+        self.update_spawner(dt)
+
+    def update_spawner(self, dt):
+        self.spawn_timer += dt
         
         # Spawn minions at regular intervals
-        if current_time - self.spawn_timer > self.spawn_interval:
-            self.spawn_minions(screen)
-            self.spawn_timer = current_time
+        if self.spawn_timer > self.spawn_interval:
+            self.spawn_minions()
+            self.spawn_timer = 0
             
-    def spawn_minions(self, screen):
+    def spawn_minions(self):
         # Spawn 2-4 regular plastic enemies around the boss
         minion_count = 2 + (self.health % 3)  # Random between 2-4
         
         for _ in range(minion_count):
-            # Create minion near the boss
-            minion = Plastic(self.crab, self.turtle, screen, self.wave_number)
-            minion.rect.centerx = self.rect.centerx + random.randint(-50, 50)
-            minion.rect.centery = self.rect.centery + random.randint(-50, 50)
-            self.plastic_group.add(minion)
\ No newline at end of file
+            # The World's entity budget may hold a minion back, merge it or make room for it
+            if self.budget is None or self.budget.admit_minion(self, self.plastic_group):
+                self.spawn_minion()
+
+    def spawn_minion(self):
+        # Create minion near the boss
+        minion = self.minion_factory(self.crab, self.turtle, self.screen_size, self.wave_number)
+        minion.move_to((self.rect.centerx + rng.randint(-50, 50),
+                        self.rect.centery + rng.randint(-50, 50)))
+        self.plastic_group.add(minion)
+        if self.budget is not None:
+            self.budget.track(minion)
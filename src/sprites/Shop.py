@@ -1,14 +1,22 @@
 import pygame
 import os
+from engine.AssetCache import assets
+from engine.Fonts import fonts
+from engine.TextLayout import paragraphs
+from engine.EffectCache import effects
 
-def round_image(image, radius):
-    """Rounds the corners of an image using a mask."""
-    size = image.get_size()
-    mask = pygame.Surface(size, pygame.SRCALPHA)
-    pygame.draw.rect(mask, (255, 255, 255, 255), (0, 0, *size), border_radius=radius)
-    rounded_image = image.copy()
-    rounded_image.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-    return rounded_image
+# Item icons and page arrows, with the size and corner radius they are drawn at (bake.py pre-processes them)
+ICONS = {
+    "turtle_health": os.path.join("assets", "images", "turte.png"),
+    "crab_health": os.path.join("assets", "images", "crab.png"),
+    "crab_damage": os.path.join("assets", "images", "crab_scute.png"),
+}
+ICON_SIZE = 80
+ICON_RADIUS = 20  # Rounded on the full-size image, before scaling
+ARROWS = (os.path.join("assets", "images", "upgrades", "arrow_left.svg"),
+          os.path.join("assets", "images", "upgrades", "arrow_right.svg"))
+ARROW_SIZE = (50, 50)
+MAX_ANIMATION_DT = 1 / 30  # Longest frame the slide moves for, seconds
 
 class Shop(pygame.sprite.Sprite):
     def __init__(self, screen, font, turtle, crab, rect):
@@ -24,34 +32,35 @@ class Shop(pygame.sprite.Sprite):
                 "price": 20,
                 "effect": "Add +1 health to Turtle",
                 "action": self.upgrade_turtle_health,
-                "icon": os.path.join("assets", "images", "turte.png"),
+                "icon": ICONS["turtle_health"],
                 "purchased": False
             },
             "crab_health": {
                 "price": 20,
                 "effect": "Add +1 health to Crab",
                 "action": self.upgrade_crab_health,
-                "icon": os.path.join("assets", "images", "crab.png"),
+                "icon": ICONS["crab_health"],
                 "purchased": False
             },
             "crab_damage": {
                 "price": 30,
                 "effect": "Double Crab's damage (One-time)",
                 "action": self.upgrade_crab_damage,
-                "icon": os.path.join("assets", "images","crab_scute.png"),
+                "icon": ICONS["crab_damage"],
                 "purchased": False
             }
         }
         
-        self.title_font = pygame.font.Font(None, 40)
-        self.desc_font = pygame.font.Font(None, 24)
+        self.title_font = fonts.get(40)
+        self.desc_font = fonts.get(24)
         self.rect = rect
         self.image = pygame.Surface(rect.size, pygame.SRCALPHA)
         
         # Animation states
         self.is_open = False
         self.is_animating = False
-        self.animation_speed = 15
+        self.animation_speed = 900  # Pixels per second
+        self.slide_y = float(screen.get_height())  # Exact panel top while sliding, rect.y is rounded from it
         self.hidden_y = screen.get_height()
         self.shown_y = (screen.get_height() - self.rect.height) // 2
         self.rect.y = self.hidden_y
@@ -60,16 +69,27 @@ class Shop(pygame.sprite.Sprite):
         self.current_page = 0
         self.items_per_page = 3
         self.hovered_item = None
-        self.icon_size = 80
+        self.icon_size = ICON_SIZE
         self.icon_padding = 30
         self.total_pages = (len(self.items) + self.items_per_page - 1) // self.items_per_page
         
         # Load assets
         self.icons = self._load_icons()
         self.arrow_left, self.arrow_right = self._load_arrows()
+        # Icons and arrows share one atlas, drawn from views into it
+        self.atlas = assets.add_atlas(dict(self.icons, arrow_left=self.arrow_left, arrow_right=self.arrow_right))
+        self.icons = {item_key: self.atlas.get(item_key) for item_key in self.icons}
+        self.arrow_left, self.arrow_right = self.atlas.get("arrow_left"), self.atlas.get("arrow_right")
         self.arrow_rect_left = pygame.Rect(20, rect.height//2 - 25, 50, 50)
         self.arrow_rect_right = pygame.Rect(rect.width - 70, rect.height//2 - 25, 50, 50)
         
+        # Cached layers, the panel is only recomposited when what it shows changes
+        self.chrome = self._build_chrome()
+        self.tiles = {}  # (item key, hovered, purchased) -> icon, price and glow
+        self.descriptions = {}  # (item key, effect text) -> description panel
+        self.coins_text = None  # (coin count, rendered text)
+        self.drawn_state = None
+        
         # Visual effects
         self.hovering_left = False
         self.hovering_right = False
@@ -100,15 +120,8 @@ class Shop(pygame.sprite.Sprite):
         icons = {}
         for item_key, item in self.items.items():
             try:
-                # Try loading from absolute path first
-                if os.path.exists(item["icon"]):
-                    icon = pygame.image.load(item["icon"]).convert_alpha()
-                else:
-                    # Try relative path if absolute fails
-                    icon = pygame.image.load(os.path.join(*item["icon"].split(os.sep))).convert_alpha()
-                
-                icon = round_image(icon, 20)
-                icons[item_key] = pygame.transform.scale(icon, (self.icon_size, self.icon_size))
+                # Baked already rounded and scaled if bake.py has been run
+                icons[item_key] = assets.load_rounded(item["icon"], (self.icon_size, self.icon_size), ICON_RADIUS)
             except Exception as e:
                 print(f"Failed to load icon {item['icon']}: {e}")
                 # Fallback if image missing
@@ -117,11 +130,10 @@ class Shop(pygame.sprite.Sprite):
     
     def _load_arrows(self):
         """Load navigation arrows with fallbacks"""
-        arrow_path = os.path.join("assets", "images", "upgrades")
         try:
-            left = pygame.image.load(os.path.join(arrow_path, "arrow_left.svg")).convert_alpha()
-            right = pygame.image.load(os.path.join(arrow_path, "arrow_right.svg")).convert_alpha()
-            return pygame.transform.scale(left, (50, 50)), pygame.transform.scale(right, (50, 50))
+            left = assets.get(ARROWS[0], ARROW_SIZE)
+            right = assets.get(ARROWS[1], ARROW_SIZE)
+            return left, right
         except Exception as e:
             print(f"Failed to load arrows: {e}")
             # Create simple arrows if images missing
@@ -140,41 +152,16 @@ class Shop(pygame.sprite.Sprite):
         icon.blit(text, (self.icon_size//2 - text.get_width()//2, self.icon_size//2 - text.get_height()//2))
         return icon
     
-    def _wrap_text(self, text, font, max_width):
-        """Wrap text to fit within max_width"""
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if font.size(test_line)[0] <= max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        return lines
-    
-    def draw(self, coin_count):
-        self.image.fill((0,0,0,0))
-        
-        # Background
-        bg = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(bg, (30,30,30,200), bg.get_rect(), border_radius=20)
-        self.image.blit(bg, (0,0))
-        
-        # Title
+    def _build_chrome(self):
+        """Rounded background and title, the part of the panel that never changes."""
+        chrome = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(chrome, (30,30,30,200), chrome.get_rect(), border_radius=20)
         title = self.title_font.render("UPGRADE SHOP", True, (255,255,255))
-        self.image.blit(title, (self.rect.width//2 - title.get_width()//2, 20))
-        
-        # Coins
-        coins_text = self.font.render(f"Coins: {coin_count}", True, (255,255,0))
-        self.image.blit(coins_text, (self.rect.width - coins_text.get_width() - 20, 20))
-        
-        # Calculate items area
+        chrome.blit(title, (self.rect.width//2 - title.get_width()//2, 20))
+        return chrome
+
+    def _page_layout(self):
+        """(item key, x, y) of every item on the current page, relative to the panel."""
         total_width = (self.items_per_page * self.icon_size) + ((self.items_per_page - 1) * self.icon_padding)
         start_x = (self.rect.width - total_width) // 2
         start_y = 80
@@ -182,84 +169,111 @@ class Shop(pygame.sprite.Sprite):
         # Get current page items
         item_keys = list(self.items.keys())
         page_items = item_keys[self.current_page*self.items_per_page : (self.current_page+1)*self.items_per_page]
+        return [(item_key, start_x + i * (self.icon_size + self.icon_padding), start_y)
+                for i, item_key in enumerate(page_items)]
+
+    def _tile(self, item_key, hovered):
+        """Icon, price and hover glow of one item, rendered once per state."""
+        item = self.items[item_key]
+        purchased = item_key == "crab_damage" and item["purchased"]
+        key = (item_key, hovered, purchased)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            return tile
+
+        # Price (show "PURCHASED" if one-time upgrade was bought)
+        if purchased:
+            price_text = self.font.render("PURCHASED", True, (100,255,100))
+        else:
+            price_text = self.font.render(f"${item['price']}", True, (255,255,255))
+
+        width = max(self.icon_size + 10, price_text.get_width())
+        tile = pygame.Surface((width, 5 + self.icon_size + 5 + price_text.get_height()), pygame.SRCALPHA)
+        icon_x = (width - self.icon_size) // 2
+        if hovered:
+            # Glow effect
+            glow = pygame.Surface((self.icon_size+10, self.icon_size+10), pygame.SRCALPHA)
+            pygame.draw.rect(glow, (255,255,255,50), glow.get_rect(), border_radius=15)
+            tile.blit(glow, (icon_x - 5, 0))
+        if purchased:
+            # Greyed out and dimmed
+            gray_icon = effects.tint(effects.grey(self.icons[item_key]), (100,100,100,150))
+            tile.blit(gray_icon, (icon_x, 5))
+        else:
+            tile.blit(self.icons[item_key], (icon_x, 5))
+        tile.blit(price_text, (width//2 - price_text.get_width()//2, 5 + self.icon_size + 5))
+        self.tiles[key] = tile
+        return tile
+
+    def _description(self, item_key):
+        """Description panel for an item, re-rendered only when its text changes."""
+        item = self.items[item_key]
+        key = (item_key, item['effect'])
+        panel = self.descriptions.get(key)
+        if panel is not None:
+            return panel
+
+        desc_width = self.rect.width - 40
+        desc_height = 80
+        panel = pygame.Surface((desc_width, desc_height), pygame.SRCALPHA)
+        pygame.draw.rect(panel, (50,50,50,150), panel.get_rect(), border_radius=10)
         
-        # Draw items
-        mouse_pos = pygame.mouse.get_pos()
+        # Item name
+        name = item_key.replace("_", " ").title()
+        name_text = self.title_font.render(name, True, (255,255,255))
+        panel.blit(name_text, (desc_width//2 - name_text.get_width()//2, 10))
+        
+        # Description, lines 20px apart
+        line_gap = 20 - self.desc_font.size(item['effect'])[1]
+        desc_text = paragraphs.render(item['effect'], 24, (220,220,220), desc_width - 20, line_gap)
+        panel.blit(desc_text, (desc_width//2 - desc_text.get_width()//2, 40))
+        self.descriptions[key] = panel
+        return panel
+
+    def _update_hover(self, mouse_pos):
+        """Work out which item or arrow is under the mouse."""
         shop_pos = (self.rect.x, self.rect.y)
         self.hovered_item = None
-        
-        for i, item_key in enumerate(page_items):
-            item = self.items[item_key]
-            x = start_x + i * (self.icon_size + self.icon_padding)
-            y = start_y
-            
-            # Hover detection
+        for item_key, x, y in self._page_layout():
             icon_rect = pygame.Rect(shop_pos[0]+x, shop_pos[1]+y, self.icon_size, self.icon_size)
             if icon_rect.collidepoint(mouse_pos):
                 self.hovered_item = item_key
-                # Glow effect
-                glow = pygame.Surface((self.icon_size+10, self.icon_size+10), pygame.SRCALPHA)
-                pygame.draw.rect(glow, (255,255,255,50), glow.get_rect(), border_radius=15)
-                self.image.blit(glow, (x-5,y-5))
-            
-            # Draw icon (always draw, not just when hovered)
-            if item_key == "crab_damage" and item["purchased"]:
-                gray_icon = self.icons[item_key].copy()
-                gray_icon.fill((100,100,100,150), special_flags=pygame.BLEND_RGBA_MULT)
-                self.image.blit(gray_icon, (x,y))
-            else:
-                self.image.blit(self.icons[item_key], (x,y))
-            
-            # Price (show "PURCHASED" if one-time upgrade was bought)
-            if item_key == "crab_damage" and item["purchased"]:
-                price_text = self.font.render("PURCHASED", True, (100,255,100))
-            else:
-                price_text = self.font.render(f"${item['price']}", True, (255,255,255))
-            self.image.blit(price_text, (x + self.icon_size//2 - price_text.get_width()//2, y + self.icon_size + 5))
+        self.hovering_left = self.arrow_rect_left.move(shop_pos).collidepoint(mouse_pos)
+        self.hovering_right = self.arrow_rect_right.move(shop_pos).collidepoint(mouse_pos)
+
+    def draw(self, coin_count):
+        """Recomposite the panel from its cached layers, only when something on it changed."""
+        state = (coin_count, self.current_page, self.hovered_item, self.hovering_left, self.hovering_right,
+                 tuple((item["purchased"], item["effect"]) for item in self.items.values()))
+        if state == self.drawn_state:
+            return
+        self.drawn_state = state
+
+        self.image.fill((0,0,0,0))
+        self.image.blit(self.chrome, (0,0))
+        
+        # Coins
+        if self.coins_text is None or self.coins_text[0] != coin_count:
+            self.coins_text = (coin_count, self.font.render(f"Coins: {coin_count}", True, (255,255,0)))
+        coins_text = self.coins_text[1]
+        self.image.blit(coins_text, (self.rect.width - coins_text.get_width() - 20, 20))
+        
+        # Draw items
+        for item_key, x, y in self._page_layout():
+            tile = self._tile(item_key, item_key == self.hovered_item)
+            self.image.blit(tile, (x + self.icon_size//2 - tile.get_width()//2, y - 5))
+
         # Description panel
         if self.hovered_item:
-            item = self.items[self.hovered_item]
-            desc_width = self.rect.width - 40
-            desc_height = 80
-            desc_x = 20
-            desc_y = start_y + self.icon_size + 30
-            
-            # Background
-            desc_bg = pygame.Surface((desc_width, desc_height), pygame.SRCALPHA)
-            pygame.draw.rect(desc_bg, (50,50,50,150), desc_bg.get_rect(), border_radius=10)
-            self.image.blit(desc_bg, (desc_x, desc_y))
-            
-            # Item name
-            name = self.hovered_item.replace("_", " ").title()
-            name_text = self.title_font.render(name, True, (255,255,255))
-            self.image.blit(name_text, (desc_x + desc_width//2 - name_text.get_width()//2, desc_y + 10))
-            
-            # Description
-            desc_lines = self._wrap_text(item['effect'], self.desc_font, desc_width - 20)
-            for i, line in enumerate(desc_lines):
-                desc_text = self.desc_font.render(line, True, (220,220,220))
-                self.image.blit(desc_text, (desc_x + desc_width//2 - desc_text.get_width()//2, desc_y + 40 + i * 20))
+            self.image.blit(self._description(self.hovered_item), (20, 80 + self.icon_size + 30))
         
         # Navigation arrows
-        self._draw_arrows(mouse_pos, shop_pos)
+        self._draw_arrows()
     
-    def _draw_arrows(self, mouse_pos, shop_pos):
-        """Draw and handle navigation arrows"""
-        # Left arrow
-        left_arrow = self.arrow_left.copy()
-        if self.arrow_rect_left.move(shop_pos).collidepoint(mouse_pos):
-            self.hovering_left = True
-            left_arrow.fill((255,255,255,150), special_flags=pygame.BLEND_RGBA_MULT)
-        else:
-            self.hovering_left = False
-        
-        # Right arrow
-        right_arrow = self.arrow_right.copy()
-        if self.arrow_rect_right.move(shop_pos).collidepoint(mouse_pos):
-            self.hovering_right = True
-            right_arrow.fill((255,255,255,150), special_flags=pygame.BLEND_RGBA_MULT)
-        else:
-            self.hovering_right = False
+    def _draw_arrows(self):
+        """Draw the navigation arrows, dimmed while hovered"""
+        left_arrow = effects.tint(self.arrow_left, (255,255,255,150)) if self.hovering_left else self.arrow_left
+        right_arrow = effects.tint(self.arrow_right, (255,255,255,150)) if self.hovering_right else self.arrow_right
         
         # Only show arrows if there are multiple pages
         if self.total_pages > 1:
@@ -307,18 +321,29 @@ class Shop(pygame.sprite.Sprite):
         if not self.is_animating:
             self.is_open = not self.is_open
             self.is_animating = True
+            if self.is_open:
+                # Forget the hover from last time, it is checked again once the panel stops
+                self.hovered_item = None
+                self.hovering_left = self.hovering_right = False
     
-    def update_animation(self):
+    def update_animation(self, dt):
+        """Slide the panel toward open or closed by dt seconds of movement."""
         if self.is_animating:
+            # A frame that follows an idle wait is long, don't let the panel jump
+            step = self.animation_speed * min(dt, MAX_ANIMATION_DT)
             if self.is_open:
-                self.rect.y = max(self.shown_y, self.rect.y - self.animation_speed)
-                if self.rect.y == self.shown_y:
+                self.slide_y = max(self.shown_y, self.slide_y - step)
+                if self.slide_y == self.shown_y:
                     self.is_animating = False
             else:
-                self.rect.y = min(self.hidden_y, self.rect.y + self.animation_speed)
-                if self.rect.y == self.hidden_y:
+                self.slide_y = min(self.hidden_y, self.slide_y + step)
+                if self.slide_y == self.hidden_y:
                     self.is_animating = False
+            self.rect.y = round(self.slide_y)
     
-    def update(self, coin_count):
-        self.update_animation()
+    def update(self, coin_count, dt):
+        self.update_animation(dt)
+        # While sliding, the finished panel just moves with rect
+        if not self.is_animating:
+            self._update_hover(pygame.mouse.get_pos())
         self.draw(coin_count)
\ No newline at end of file
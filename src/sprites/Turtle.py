@@ -1,14 +1,15 @@
 import pygame
 import math
 from sprites.Bullet import TurtleBullet
+from engine.AssetCache import assets
+from engine.RotationCache import rotations
+from engine.Masks import masks_overlap
 
 class Turtle(pygame.sprite.Sprite):
     def __init__(self, crosshair):
         super().__init__()
-        original_image = pygame.image.load("assets/images/turtle.png").convert_alpha()
-
-        # Scale the image to a smaller size (adjust the values as needed)
-        self.original_image = pygame.transform.scale(original_image, (100, 100))  
+        # Shared image, scaled to 100x100 by the asset cache
+        self.original_image = assets.get("assets/images/turtle.png", (100, 100))
         self.image = self.original_image
         self.rect = self.image.get_rect(center=(400, 300))
 
@@ -19,14 +20,16 @@ class Turtle(pygame.sprite.Sprite):
         self.update_hitbox()  # Align hitbox with the turtle's rect
 
         self.pos = pygame.Vector2(self.rect.center)
-        self.speed = 5
+        self.prev_pos = self.pos.copy()  # Position at the previous sim step, for interpolation
+        self.speed = 300  # Pixels per second
         self.stop_distance = 5
 
         self.health = 3
 
         # Cooldown properties
-        self.shoot_cooldown = 560  # Cooldown time in milliseconds (0.3 seconds)
-        self.last_shot_time = 0  # Timestamp of the last shot
+        self.shoot_cooldown = 0.56  # Cooldown time in seconds
+        self.shoot_timer = 0  # Sim time left until the turtle can shoot again
+        self.bullet_factory = TurtleBullet  # World swaps in its bullet pool
 
         self.crosshair = crosshair  # Save reference to crosshair
 
@@ -34,7 +37,10 @@ class Turtle(pygame.sprite.Sprite):
         """Keep the hitbox centered within the turtle's rect."""
         self.hitbox.center = self.rect.center
 
-    def update(self, screen):
+    def update(self, dt):
+        """Advance the turtle by one sim step of dt seconds."""
+        self.shoot_timer = max(0, self.shoot_timer - dt)
+
         # Get the crosshair position
         crosshair_pos = self.crosshair.pos
 
@@ -45,27 +51,24 @@ class Turtle(pygame.sprite.Sprite):
         # Move only if the turtle is not too close to the crosshair
         if distance > self.stop_distance:
             direction = direction.normalize()  # Normalize for consistent speed
-            self.pos += direction * self.speed  # Move towards crosshair
+            # Move towards crosshair without overshooting it
+            self.pos += direction * min(self.speed * dt, distance)
 
         # Rotate towards the crosshair
         if distance > 1:  # Avoid jittering when very close
             angle = math.degrees(math.atan2(-direction.y, direction.x))  
-            self.image = pygame.transform.rotate(self.original_image, angle + 270)
+            self.image = rotations.get(self.original_image, angle + 270).image
 
         # Update rect to match new position
         self.update_hitbox()
         self.rect = self.image.get_rect(center=self.pos)
 
-        # pygame.draw.rect(screen, (255, 0, 0), self.hitbox, 2)  # Red border for hitbox
-
     def shoot(self, bullets_group, target_pos):
         """Creates a bullet with cooldown and adds it to the bullets group."""
-        current_time = pygame.time.get_ticks()  # Get current time in milliseconds
-
-        if current_time - self.last_shot_time >= self.shoot_cooldown:
-            bullet = TurtleBullet(self.rect.center, target_pos)  # Shoot towards crosshair
+        if self.shoot_timer <= 0:
+            bullet = self.bullet_factory(self.pos, target_pos)  # Shoot towards crosshair
             bullets_group.add(bullet)
-            self.last_shot_time = current_time  # Update last shot time
+            self.shoot_timer = self.shoot_cooldown  # Restart the cooldown
 
     def take_damage(self, amount=1):
         """Decreases the turtle's health and checks for game over."""
@@ -73,9 +76,13 @@ class Turtle(pygame.sprite.Sprite):
         if self.health <= 0:
             self.health = 0
 
-    def check_bullet_collision(self, bullets_group):
-        """Check if a bullet collides with the turtle's hitbox."""
-        for bullet in bullets_group:
-            if self.hitbox.colliderect(bullet.hitbox):  # Check for collision with bullet's hitbox
+    def check_bullet_collision(self, spatial_hash, precise=False):
+        """Check if anything indexed in the spatial hash collides with the turtle's hitbox.
+
+        precise also requires the two images' opaque pixels to overlap.
+        """
+        for bullet in spatial_hash.query(self.hitbox):
+            # Check for collision with bullet's hitbox
+            if self.hitbox.colliderect(bullet.hitbox) and (not precise or masks_overlap(self, bullet)):
                 self.take_damage()  # Decrease health if collision occurs
                 bullet.kill()  # Remove the bullet after collision
@@ -0,0 +1,18 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture(scope="session", autouse=True)
+def game():
+    """Asset paths are relative to the repository root, and convert_alpha() needs a video mode."""
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+    os.chdir(cwd)
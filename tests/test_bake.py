@@ -0,0 +1,56 @@
+import json
+import os
+from bake import bake, check
+from engine.Baked import BakedAssets, MANIFEST, BAKE_VERSION, spec_key, file_hash, file_size
+
+def test_cleanup_deletes_only_files_an_earlier_manifest_listed(tmp_path):
+    (tmp_path / "notes.txt").write_text("not ours")
+    (tmp_path / "old.40x40.deadbeef.png").write_bytes(b"listed")
+    (tmp_path / MANIFEST).write_text(json.dumps({"version": BAKE_VERSION, "rotations": {},
+                                                 "entries": {"old": {"file": "old.40x40.deadbeef.png"}}}))
+    manifest = bake(str(tmp_path))
+
+    assert manifest["entries"]
+    assert (tmp_path / "notes.txt").exists()
+    assert not (tmp_path / "old.40x40.deadbeef.png").exists()
+    for entry in manifest["entries"].values():
+        assert (tmp_path / entry["file"]).exists()
+    assert check(str(tmp_path)) == []
+
+def test_first_bake_deletes_nothing(tmp_path):
+    (tmp_path / "old.40x40.deadbeef.png").write_bytes(b"unlisted")
+    bake(str(tmp_path))
+    assert (tmp_path / "old.40x40.deadbeef.png").exists()
+
+def baked_one(tmp_path):
+    """A manifest with one entry whose source is a file in tmp_path, and the BakedAssets lookup for it."""
+    source, baked = tmp_path / "source.png", tmp_path / "source.10x10.png"
+    source.write_bytes(b"source bytes")
+    baked.write_bytes(b"baked")
+    entry = {"source": str(source), "source_sha1": file_hash(str(source)), "source_size": file_size(str(source)),
+             "file": baked.name, "file_sha1": file_hash(str(baked)), "file_size": file_size(str(baked))}
+    (tmp_path / MANIFEST).write_text(json.dumps({"version": BAKE_VERSION, "rotations": {},
+                                                 "entries": {spec_key(str(source), (10, 10)): entry}}))
+    return source, baked, lambda: BakedAssets(str(tmp_path)).lookup(str(source), (10, 10))
+
+def test_current_entry_is_used(tmp_path):
+    source, baked, lookup = baked_one(tmp_path)
+    assert lookup() == os.path.join(str(tmp_path), baked.name)
+    os.utime(source, (0, 0))  # A checkout or copy only changes times
+    assert lookup() is not None
+
+def test_changed_source_is_rejected(tmp_path):
+    source, baked, lookup = baked_one(tmp_path)
+    source.write_bytes(b"a longer edited source")
+    assert lookup() is None
+
+def test_changed_baked_file_is_rejected(tmp_path):
+    source, baked, lookup = baked_one(tmp_path)
+    baked.write_bytes(b"truncated")
+    assert lookup() is None
+
+def test_check_compares_hashes(tmp_path):
+    source, baked, lookup = baked_one(tmp_path)
+    source.write_bytes(b"SOURCE BYTES")  # Same size, only the hash tells
+    assert lookup() is not None
+    assert len(check(str(tmp_path))) == 1
@@ -0,0 +1,37 @@
+from engine.World import World, Inputs
+from engine.Waves import WaveBook
+from engine.Budget import EntityBudget, DEFER, MERGE, DESPAWN_OLDEST
+
+CAP = 98
+
+def flood(policy, ticks=300):
+    """A boss wave spawning far more plastics per tick than the cap, none of them moving. Returns the peak and the world."""
+    waves = WaveBook({"count": 1000, "spawn_interval": 0.001, "speed_multiplier": 0.0, "minion_interval": 0.2,
+                      "waves": {"1": {"boss": True}}})
+    world = World(waves=waves, budget=EntityBudget(CAP, policy))
+    world.reset(1)
+    inputs = Inputs()
+    peak = 0
+    for _ in range(ticks):
+        world.step(1 / 60, inputs)
+        peak = max(peak, len(world.plastic_group))
+    return peak, world
+
+def test_defer_keeps_wave_spawns_queued():
+    peak, world = flood(DEFER)
+    assert peak == CAP
+    assert world.budget.stalled_ticks > 0
+    assert not world.schedule.done  # What didn't fit is still to come
+    assert world.total_plastic_spawned + len(world.schedule.events) == 1000
+
+def test_merge_never_exceeds_the_cap():
+    peak, world = flood(MERGE)
+    assert peak == CAP
+    assert world.budget.merged > 0
+    assert world.schedule.done
+
+def test_despawn_oldest_never_exceeds_the_cap():
+    peak, world = flood(DESPAWN_OLDEST)
+    assert peak == CAP
+    assert world.budget.despawned > 0
+    assert world.schedule.done
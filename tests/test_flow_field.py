@@ -0,0 +1,43 @@
+import math
+import pytest
+from engine.World import World
+from engine.FlowField import FlowField
+from engine.Rng import rng, reseed
+from sprites.Plastic import Plastic
+
+pytestmark = pytest.mark.skipif(not FlowField.available, reason="numpy not installed")
+
+def crowd(use_plastic_store, count=500, ticks=300):
+    """Every plastic's exact position each tick, swarming a crab that walks a circle."""
+    reseed(3)
+    world = World(use_plastic_store=use_plastic_store)
+    world.reset(20)
+    for _ in range(count):
+        plastic = Plastic(world.crab, world.turtle, world.size, world.wave_number)
+        plastic.move_to((rng.uniform(100, 700), rng.uniform(50, 550)))
+        world.plastic_group.add(plastic)
+
+    crab = world.crab
+    samples = []
+    for tick in range(ticks):
+        crab.pos.update(200 + 100 * math.cos(tick / 60), 200 + 100 * math.sin(tick / 60))
+        crab.rect.center = crab.pos
+        if tick == 100:
+            world.turtle.health = 0  # Everything retargets the crab
+        if tick % 37 == 0:
+            for plastic in list(world.plastic_group)[:20]:
+                plastic.take_damage(1)  # Some plastics blink and sit out the count
+        world.flow.update(world.players)
+        world.plastic_group.update(1 / 60, world.flow)
+        samples.append(sorted(tuple(plastic.pos) for plastic in world.plastic_group))
+    return samples, world.flow
+
+def test_store_follows_the_field_like_sprites():
+    sprites, _ = crowd(False)
+    assert crowd(True)[0] == sprites
+
+def test_crowd_spreads_over_cells():
+    samples, flow = crowd(False)
+    occupied = {flow.cell_of(round(x), round(y)) for x, y in samples[-1]}
+    assert len(occupied) > 1
+    assert len(set(samples[-1])) == len(samples[-1])
@@ -0,0 +1,30 @@
+import pytest
+from engine.World import World, Inputs
+from engine.PlasticStore import PlasticStore
+from engine.Rng import reseed
+from headless import autopilot
+
+def trace(use_plastic_store, ticks=1500):
+    """Coins, wave and every plastic's rect every 100 ticks of an autopiloted game."""
+    reseed(5)
+    world = World(use_plastic_store=use_plastic_store)
+    world.reset(7)
+    world.prewarm_pools()
+    inputs = Inputs()
+    samples = []
+    for tick in range(ticks):
+        autopilot(world, inputs)
+        world.step(1 / 60, inputs)
+        if world.wave_cleared:
+            world.start_wave()
+        world.turtle.health = world.crab.health = 3
+        if tick % 100 == 0:
+            samples.append((world.coin_count, world.wave_number,
+                            sorted(tuple(plastic.rect) for plastic in world.plastic_group)))
+    return samples
+
+@pytest.mark.skipif(not PlasticStore.available, reason="numpy not installed")
+def test_store_matches_sprites():
+    sprites = trace(False)
+    assert any(plastics for _, _, plastics in sprites)
+    assert trace(True) == sprites
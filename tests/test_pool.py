@@ -0,0 +1,68 @@
+import pygame
+from engine.Pool import Pool
+from engine.Rng import reseed
+from sprites.Plastic import Plastic
+from sprites.Bullet import TurtleBullet, CrabBullet
+from sprites.Turtle import Turtle
+from sprites.Crab import Crab
+from sprites.CrossHair import Crosshair
+
+def state(sprite):
+    """Every per-use attribute of a sprite, with rects and vectors as plain tuples."""
+    skip = {"pool", "store", "slot", "_Sprite__g"}
+    result = {}
+    for name, value in vars(sprite).items():
+        if name in skip:
+            continue
+        if isinstance(value, (pygame.Rect, pygame.Vector2)):
+            value = tuple(value)
+        result[name] = value
+    return result
+
+def reused_and_fresh(cls, args, use):
+    """A sprite acquired from a pool after being used and killed, and one built from scratch, from the same seed."""
+    pool = Pool(cls)
+    group = pygame.sprite.Group()
+    sprite = pool.acquire(*args)
+    group.add(sprite)
+    use(sprite)
+    sprite.kill()
+    assert pool.free == [sprite]
+
+    reseed(5)
+    fresh = cls(*args)
+    reseed(5)
+    reused = pool.acquire(*args)
+    assert reused is sprite
+    return reused, fresh
+
+def test_plastic_resets_like_new():
+    players = (Crab(), Turtle(Crosshair((400, 300))))
+
+    def use(plastic):
+        plastic.update(1 / 60)
+        plastic.take_damage()
+        plastic.update(1 / 60)
+        plastic.speed = 999
+
+    reused, fresh = reused_and_fresh(Plastic, players + ((800, 600), 3), use)
+    assert state(reused) == state(fresh)
+
+def test_bullets_reset_like_new():
+    def use(bullet):
+        for _ in range(10):
+            bullet.update(1 / 60)
+
+    reused, fresh = reused_and_fresh(TurtleBullet, ((400, 300), (700, 100)), use)
+    assert state(reused) == state(fresh)
+    reused, fresh = reused_and_fresh(CrabBullet, ((200, 200), pygame.Vector2(0, -1)), use)
+    assert state(reused) == state(fresh)
+
+def test_prewarmed_sprites_are_reused():
+    pool = Pool(Plastic)
+    pool.prewarm(4)
+    players = (Crab(), Turtle(Crosshair((400, 300))))
+    plastics = [pool.acquire(*players, (800, 600), 1) for _ in range(4)]
+    assert pool.created == 4
+    assert pool.stats()["live"] == 4
+    assert all(plastic.health == 100 for plastic in plastics)
@@ -0,0 +1,60 @@
+import pygame
+from engine.World import World, Inputs
+from engine.Rng import reseed
+from engine.Fonts import fonts
+from engine.Recorder import InputRecorder, InputLog, TICK, START_WAVE, RESET, BUY, SMOOTHING, outcome
+from sprites.Shop import Shop
+from headless import autopilot
+from replay import replay
+
+SEED = 11
+
+def record(path, ticks=1200):
+    """Play an autopiloted session the way main.py records one, return its outcome."""
+    reseed(SEED)
+    world = World()
+    world.prewarm_pools()
+    recorder = InputRecorder(path, SEED, 60)
+    inputs = Inputs()
+    shop = Shop(pygame.Surface(world.size), fonts.get(30), world.turtle, world.crab,
+                pygame.Rect(world.size[0] // 2 - 300, world.size[1], 600, 400))
+    world.start_wave()
+    recorder.start_wave()
+    for tick in range(ticks):
+        autopilot(world, inputs)
+        if tick == 300:
+            world.crosshair.smoothing = False
+            recorder.smoothing(False)
+        if tick == 400:
+            world.coin_count -= shop.items["crab_health"]["action"](world.coin_count)
+            recorder.buy("crab_health")
+        recorder.tick(inputs)
+        world.step(1 / 60, inputs)
+        if world.wave_cleared:
+            world.start_wave()
+            recorder.start_wave()
+        if world.game_over:
+            world.reset()
+            recorder.reset()
+    recorder.close(world)
+    return outcome(world)
+
+def test_replay_is_identical(tmp_path):
+    path = tmp_path / "session.rec"
+    recorded = record(str(path))
+    result = replay(InputLog.load(str(path)))
+    assert result["outcome"] == recorded
+    assert result["identical"]
+
+def test_log_round_trips_records(tmp_path):
+    path = tmp_path / "session.rec"
+    recorded = record(str(path), ticks=500)
+    log = InputLog.load(str(path))
+    assert (log.seed, log.hz) == (SEED, 60)
+    assert tuple(log.outcome) == recorded
+    kinds = [record[0] for record in log.records]
+    assert kinds.count(TICK) == 500
+    assert kinds[0] == START_WAVE
+    assert (SMOOTHING, 0) in log.records
+    assert (BUY, "crab_health") in log.records
+    assert all(kind in (TICK, START_WAVE, RESET, BUY, SMOOTHING) for kind in kinds)
@@ -0,0 +1,35 @@
+import random
+import pygame
+from engine.SpatialHash import SpatialHash
+
+def box(rect):
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(rect)
+    return sprite
+
+def test_query_matches_brute_force():
+    layout = random.Random(7)
+    group = pygame.sprite.Group()
+    # Random sizes and spots, plus sprites straddling one, two and four cell edges and sitting on them exactly
+    for _ in range(300):
+        group.add(box((layout.randint(-40, 800), layout.randint(-40, 600), layout.randint(1, 150), layout.randint(1, 150))))
+    for rect in ((60, 10, 10, 10), (10, 60, 10, 10), (60, 60, 10, 10), (64, 64, 64, 64), (0, 0, 64, 64), (127, 0, 2, 2)):
+        group.add(box(rect))
+    sprites = group.sprites()
+    spatial = SpatialHash(cell_size=64)
+    spatial.rebuild(sprites)
+
+    queries = [pygame.Rect(layout.randint(-50, 800), layout.randint(-50, 600), layout.randint(1, 120), layout.randint(1, 120))
+               for _ in range(300)]
+    queries += [pygame.Rect(63, 63, 2, 2), pygame.Rect(64, 0, 1, 1), pygame.Rect(0, 0, 64, 64)]
+    for rect in queries:
+        expected = [sprite for sprite in sprites if sprite.rect.colliderect(rect)]
+        assert [sprite for sprite in spatial.query(rect) if sprite.rect.colliderect(rect)] == expected
+
+def test_killed_sprites_are_skipped():
+    group = pygame.sprite.Group(box((0, 0, 10, 10)), box((5, 5, 10, 10)))
+    first, second = group.sprites()
+    spatial = SpatialHash()
+    spatial.rebuild(group)
+    first.kill()
+    assert spatial.query(pygame.Rect(0, 0, 20, 20)) == [second]
@@ -0,0 +1,23 @@
+from engine.Waves import WaveBook, BOSS, PLASTIC
+
+def calc_plastic_total_spawned(wave_number):
+    """The total main.py hard-coded before waves came from a file."""
+    return 3 * sum(range(wave_number)) + wave_number * 4
+
+def test_default_totals_match_old_formula():
+    book = WaveBook()
+    for wave in range(0, 40):
+        assert book.total_count(wave) == calc_plastic_total_spawned(wave)
+
+def test_boss_waves_spawn_boss_first():
+    book = WaveBook()
+    schedule = book.wave(3).compile()
+    kinds = list(schedule.advance(1000))
+    assert kinds[0] == BOSS
+    assert kinds.count(PLASTIC) == book.wave(3).count - 1
+
+def test_overrides_replace_defaults():
+    book = WaveBook({"count": 5, "waves": {"2": {"count": 9, "boss": True}}})
+    assert book.wave(1).count == 5
+    assert book.wave(2).count == 9 and book.is_boss_wave(2)
+    assert book.total_count(3) == 5 + 9 + 5